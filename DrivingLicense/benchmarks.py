@@ -0,0 +1,418 @@
+# benchmarks.py
+# Small timing and memory scripts for the quiz. Run from this folder, e.g.:
+#     python benchmarks.py bank
+# (running it without arguments runs them all; "soak", "results", "restart" and "next" need a display)
+
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+from PIL import Image, ImageChops, ImageStat
+
+import question_bank
+from sign_crops import sign_crops
+
+
+def bench_bank(number=200):
+    """Per-call cost of get_questions() before and after the compiled question bank."""
+    from DrivingLicenseTester import get_questions
+
+    # Before: every call re-executed the ~2,500 lines of pool literals, then drew 10/10/10 and shuffled
+    with open(question_bank.SOURCE_PATH, encoding="utf-8") as f:
+        code = compile(f.read(), question_bank.SOURCE_PATH, "exec")
+
+    def old_get_questions():
+        pools = {}
+        exec(code, pools)
+        questions = (random.sample(pools["sign_pool"], 10)
+                     + random.sample(pools["safety_pool"], 10)
+                     + random.sample(pools["law_pool"], 10))
+        random.shuffle(questions)
+        return questions
+
+    before = timeit.timeit(old_get_questions, number=number) / number
+
+    # One-off cost paid by the first call in a process
+    first = timeit.timeit(lambda: question_bank.load_pools(reload=True), number=1)
+
+    # After: the pools are already parsed, only the 10/10/10 draw remains
+    after = timeit.timeit(get_questions, number=number) / number
+
+    print(f"get_questions() per call (before): {before * 1e6:9.1f} us")
+    print(f"artifact load, once per process:   {first * 1e6:9.1f} us")
+    print(f"get_questions() per call (after):  {after * 1e6:9.1f} us")
+    print(f"speedup per call: {before / after:.1f}x")
+
+
+def _scaled_pools(pools, scale, distinct_options=False):
+    """
+    Returns copies of the pools repeated `scale` times, with fresh unique IDs.
+    With distinct_options every copy gets answer texts of its own, as a real
+    bank that size would, instead of sharing the ~550 texts of the pools.
+    """
+    scaled = {}
+    next_id = 1
+    for name, pool in pools.items():
+        scaled[name] = []
+        for copy in range(scale):
+            for entry in pool:
+                options = entry["options"]
+                if distinct_options and copy:
+                    options = [f"{text} ({copy})" for text in options]
+                scaled[name].append(dict(entry, id=next_id, options=options))
+                next_id += 1
+    return scaled
+
+
+def _shuffle_draw(questions, blueprint):
+    """The old get_new_questions() strategy: shuffle a full copy, then pick by category."""
+    available = questions.copy()
+    random.shuffle(available)
+    remaining = dict(blueprint)
+    selected = []
+    for q in available:
+        if remaining.get(q.category_name, 0) > 0:
+            selected.append(q)
+            remaining[q.category_name] -= 1
+    return selected
+
+
+def bench_sample(number=200):
+    """Cost of drawing one exam as the bank grows: full shuffle vs QuestionBank.sample()."""
+    pools = question_bank.load_pools()
+    for scale in (1, 100, 1000):
+        bank = question_bank.QuestionBank.from_pools(_scaled_pools(pools, scale))
+        blueprint = question_bank.EXAM_BLUEPRINT
+        runs = max(1, number // scale)
+        before = timeit.timeit(lambda: _shuffle_draw(bank.all_questions(), blueprint), number=runs) / runs
+        after = timeit.timeit(lambda: bank.sample(blueprint, random), number=number) / number
+        print(f"{len(bank):>7} questions: shuffle draw {before * 1e6:10.1f} us, "
+              f"QuestionBank.sample {after * 1e6:6.1f} us")
+
+
+def _traced_size(build):
+    """Returns the bytes still allocated by build()'s result once it has returned."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def bench_memory(scale=100):
+    """Resident size of the bank as plain dicts vs Question objects with array columns."""
+    with open(question_bank.ARTIFACT_PATH, encoding="utf-8") as f:
+        text = json.dumps(_scaled_pools(json.load(f)["pools"], scale))
+
+    def as_dicts():
+        return json.loads(text)
+
+    def as_questions():
+        return question_bank.QuestionBank.from_pools(json.loads(text))
+
+    dicts = _traced_size(as_dicts)
+    questions = _traced_size(as_questions)
+    count = len(question_bank.QuestionBank.from_pools(json.loads(text)))
+    print(f"{count} questions")
+    print(f"dict layout:     {dicts / 1024:9.0f} KiB ({dicts / count:5.0f} B/question)")
+    print(f"Question layout: {questions / 1024:9.0f} KiB ({questions / count:5.0f} B/question)")
+
+
+def _write_store(path, scale):
+    import question_store
+
+    pools = _scaled_pools(question_bank.load_pools(), scale, distinct_options=True)
+    question_store.migrate(path, question_bank.QuestionBank.from_pools(pools))
+
+
+def bench_store(scale=500, number=200):
+    """Drawing exams from a ~100k question SQLite store: time per exam and memory held."""
+    import question_store
+    from concurrent.futures import ProcessPoolExecutor
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "questions.db")
+        # Written by another process, so this one's option_table only holds what the exams add to it
+        with ProcessPoolExecutor(1) as pool:
+            pool.submit(_write_store, path, scale).result()
+        gc.collect()
+
+        store = question_store.SQLiteQuestionStore(path)
+        options_before = len(question_bank.option_table)
+        tracemalloc.start()
+        per_exam = timeit.timeit(lambda: store.sample(question_bank.EXAM_BLUEPRINT, random), number=number) / number
+        size, peak = tracemalloc.get_traced_memory()
+        after_number = size
+        timeit.timeit(lambda: store.sample(question_bank.EXAM_BLUEPRINT, random), number=9 * number)
+        size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        answers = store.connection.execute("SELECT COUNT(*) FROM options").fetchone()[0]
+        print(f"{len(store)} questions, {answers} answer texts, in {os.path.getsize(path) / 1e6:.1f} MB")
+        print(f"draw + resolve one exam: {per_exam * 1e3:.2f} ms")
+        print(f"memory after {number} exams: {after_number / 1024:.0f} KiB, after {10 * number}: "
+              f"{size / 1024:.0f} KiB (peak {peak / 1024:.0f} KiB)")
+        print(f"option_table grew by {len(question_bank.option_table) - options_before} texts")
+        store.close()
+
+
+def bench_versions(scale=100, versions=50):
+    """Memory per bank version when each version edits one question."""
+    bank = question_bank.QuestionBank.from_pools(_scaled_pools(question_bank.load_pools(), scale))
+    ids = [q.id for q in bank.all_questions()]
+
+    def edit_chain():
+        chain = [bank]
+        for _ in range(versions):
+            q = chain[-1].get(random.choice(ids))
+            edited = question_bank.Question(q.id, q.text + " (edited)", q.option_ids, q.correct, q.category, q.image)
+            chain.append(chain[-1].derive([edited]))
+        return chain
+
+    def deep_copies():
+        return [question_bank.QuestionBank(bank.all_questions()) for _ in range(versions)]
+
+    shared = _traced_size(edit_chain)
+    copied = _traced_size(deep_copies)
+    print(f"{len(bank)} questions, {versions} versions with one edit each")
+    print(f"derived versions: {shared / versions / 1024:8.1f} KiB per version")
+    print(f"rebuilt versions: {copied / versions / 1024:8.1f} KiB per version")
+
+
+def _lanczos_only(img, max_size):
+    """The old resize_image(): LANCZOS straight from the full-size source."""
+    width, height = img.size
+    if width > height:
+        size = (max_size, int(height * max_size / width))
+    else:
+        size = (int(width * max_size / height), max_size)
+    return img.resize(size, Image.LANCZOS)
+
+
+def bench_resize(number=20):
+    """Tiered resize_image() vs LANCZOS alone, on the sign crops and the whole sheets, with pixel differences."""
+    import sign_images
+
+    sheets = sign_images.SheetStore()
+    crops = []
+    for page, box in sign_crops.values():
+        width, height = sheets.size(page)
+        left, top, right, bottom = box
+        if 0 <= left < right <= width and 0 <= top < bottom <= height:
+            crops.append(sheets.crop_image(page, box))
+    pages = sorted({page for page, _ in sign_crops.values()})
+    sources = {
+        f"{len(crops)} sign crops": crops,
+        f"{len(pages)} whole sheets": [sheets.crop_image(page, (0, 0) + sheets.size(page)) for page in pages],
+    }
+
+    for label, images in sources.items():
+        for size in sign_images.THUMBNAIL_SIZES:
+            before = timeit.timeit(lambda: [_lanczos_only(img, size) for img in images], number=number) / number
+            after = timeit.timeit(lambda: [sign_images.resize_image(img, size) for img in images],
+                                  number=number) / number
+            worst = mean = 0
+            for img in images:
+                diff = ImageChops.difference(_lanczos_only(img, size), sign_images.resize_image(img, size))
+                worst = max(worst, max(high for _, high in diff.getextrema()))
+                mean = max(mean, max(ImageStat.Stat(diff).mean))
+            print(f"{label} -> {size:3d}px: LANCZOS {before * 1e3:7.2f} ms, tiered {after * 1e3:7.2f} ms "
+                  f"({before / after:4.1f}x), max pixel diff {worst:3d}, worst mean diff {mean:.2f}")
+
+
+# bench_soak fails if, between exam 100 and the last exam, traced memory grows by more
+# than this share or the number of Tk images by more than SOAK_IMAGE_SLACK
+SOAK_MEMORY_GROWTH = 0.10
+SOAK_IMAGE_SLACK = 10
+
+
+def bench_soak(exams=1000):
+    """Runs exams back to back through the real UI; memory and live images must stay flat. Needs a display."""
+    from DrivingLicenseTester import ModernQuizApp
+
+    app = ModernQuizApp()
+    app.update()  # Shown, so the cards and the review list are laid out at their real sizes
+    tracemalloc.start()
+    baseline = None
+    for exam in range(1, exams + 1):
+        # Answer every question; the last next_question() shows the results screen
+        while app.current_question < len(app.questions):
+            app.var.set(random.randrange(3))
+            app.next_question()
+        app.update()
+
+        if exam == 1 or exam % 100 == 0 or exam == exams:
+            gc.collect()
+            size, _ = tracemalloc.get_traced_memory()
+            images = len(app.image_names())
+            print(f"exam {exam:5d}: {size / 1024:8.0f} KiB traced, {images:4d} Tk images, "
+                  f"{len(app.photos):3d} photos pinned, image cache {app.image_cache.stats()}")
+            # Measured once the caches have filled up
+            if baseline is None and exam >= min(100, exams):
+                baseline = size, images
+        app.new_quiz()
+    tracemalloc.stop()
+    _close(app)
+
+    grown = size > baseline[0] * (1 + SOAK_MEMORY_GROWTH)
+    leaked = images > baseline[1] + SOAK_IMAGE_SLACK
+    if grown or leaked:
+        print(f"FAILED: from {baseline[0] / 1024:.0f} KiB and {baseline[1]} Tk images to "
+              f"{size / 1024:.0f} KiB and {images} Tk images")
+        sys.exit(1)
+    print(f"OK: memory and Tk images stayed within bounds of exam {min(100, exams)}")
+
+
+def bench_results(rounds=5):
+    """Time to build the results screen for 30 and 100 question exams, per review view. Needs a display."""
+    from review_views import REVIEW_VIEWS
+
+    for review in REVIEW_VIEWS:
+        print(f"--review {review}")
+        _time_results(review, rounds)
+
+
+def _time_results(review, rounds):
+    from DrivingLicenseTester import ModernQuizApp
+
+    app = ModernQuizApp(review=review)
+    app.update()
+
+    # The screen is up (header, score, buttons painted) when the first review batch starts
+    first_batches = []
+    stream_review = app.stream_review
+
+    def timed_stream_review(review_list, entries, start=0):
+        if start == 0:
+            first_batches.append(timeit.default_timer())
+        stream_review(review_list, entries, start)
+
+    app.stream_review = timed_stream_review
+    for blueprint in (question_bank.EXAM_BLUEPRINT, {"Signs": 34, "Safety": 33, "Law": 33}):
+        total = first_paint = 0.0
+        for _ in range(rounds):
+            app.new_quiz()
+            app.question_ids = app.store.sample_ids(blueprint, random)
+            app.questions = app.store.resolve(app.question_ids)
+            app.user_answers = [random.randrange(3) for _ in app.questions]
+            app.current_question = len(app.questions)
+            app.update()
+            start = timeit.default_timer()
+            app.finish_quiz()
+            while app.review_job is not None:  # The review streams in from timer callbacks
+                app.update()
+            app.update()
+            total += timeit.default_timer() - start
+            first_paint += first_batches[-1] - start
+        widgets = sum(1 for _ in _descendants(app))
+        print(f"{len(app.questions):3d} questions: first paint {first_paint / rounds * 1e3:7.1f} ms, "
+              f"every card in {total / rounds * 1e3:7.1f} ms, {widgets} widgets")
+    _close(app)
+
+
+def bench_restart(rounds=20):
+    """Time from the results screen to the next exam's first question. Needs a display."""
+    from DrivingLicenseTester import ModernQuizApp
+
+    app = ModernQuizApp()
+    app.update()
+
+    def rebuild():
+        # What retry_quiz() did before the views were kept: tear the whole widget tree down and build it again
+        for widget in app.winfo_children():
+            widget.destroy()
+        app.create_widgets()
+        app.retry_quiz()
+
+    for name, restart in (("destroy and rebuild", rebuild), ("retry_quiz", app.retry_quiz),
+                          ("new_quiz", app.new_quiz)):
+        total = 0.0
+        for _ in range(rounds):
+            app.user_answers = [random.randrange(3) for _ in app.questions]
+            app.current_question = len(app.questions)
+            app.finish_quiz()
+            app.update()
+            start = timeit.default_timer()
+            restart()
+            app.update()
+            total += timeit.default_timer() - start
+        print(f"{name:20s} {total / rounds * 1e3:7.1f} ms, {sum(1 for _ in _descendants(app))} widgets")
+    _close(app)
+
+
+def bench_next(exams=5):
+    """Click-to-paint time of "Next Question", with and without the next card prepared. Needs a display."""
+    from DrivingLicenseTester import ModernQuizApp
+    from question_cards import PREPARE_DELAY
+
+    app = ModernQuizApp()
+    app.update()
+    for prepared in (False, True):
+        times = []
+        for _ in range(exams):
+            app.new_quiz()
+            while app.current_question < len(app.questions) - 1:
+                if prepared:
+                    # The candidate reads for longer than PREPARE_DELAY
+                    app.after(PREPARE_DELAY + 10)
+                    app.update()
+                elif app.prepare_job is not None:
+                    app.after_cancel(app.prepare_job)
+                    app.prepare_job = None
+                app.var.set(random.randrange(3))
+                start = timeit.default_timer()
+                app.next_question()
+                app.update_idletasks()
+                times.append(timeit.default_timer() - start)
+        times.sort()
+        print(f"{'prepared' if prepared else 'unprepared':10s} mean {sum(times) / len(times) * 1e3:6.2f} ms, "
+              f"95th percentile {times[int(len(times) * 0.95)] * 1e3:6.2f} ms, "
+              f"worst {times[-1] * 1e3:6.2f} ms, {sum(t > 0.016 for t in times)}/{len(times)} over 16 ms")
+    _close(app)
+
+
+def _close(app):
+    # Collected here, on the Tk thread: otherwise the next collection may happen on an
+    # image prefetch worker, and Tk objects must not be freed from another thread
+    app.destroy()
+    gc.collect()
+
+
+def _descendants(widget):
+    for child in widget.winfo_children():
+        yield child
+        yield from _descendants(child)
+
+
+BENCHMARKS = {
+    "bank": bench_bank,
+    "sample": bench_sample,
+    "memory": bench_memory,
+    "store": bench_store,
+    "versions": bench_versions,
+    "resize": bench_resize,
+    "soak": bench_soak,
+    "results": bench_results,
+    "restart": bench_restart,
+    "next": bench_next,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"unknown benchmark {name!r}, choose from: {', '.join(BENCHMARKS)}")
+            sys.exit(2)
+        print(f"== {name} ==")
+        BENCHMARKS[name]()
@@ -0,0 +1,247 @@
+# detect_signs.py
+# Finds the signs on the sheet screenshots in Images/ instead of relying on
+# hand-typed boxes: every pixel that is clearly not paper (dark or coloured) is
+# foreground, touching foreground pixels are grouped into components, and each
+# group big enough to be a sign gives one tight box. Boxes are numbered in
+# reading order from the first caption of their page (PAGE_FIRST_SIGN), the
+# same way the sheets label them (1.jpg, 2.jpg, ...), which is what
+# sign_id_for() maps question images to.
+#
+# Compare the detected boxes with sign_crops.py:
+#     python detect_signs.py diff
+# Regenerate sign_crops.py (after replacing the screenshots) with:
+#     python detect_signs.py write
+#
+# Needs NumPy.
+
+import os
+import sys
+import time
+
+import numpy
+
+from sign_crops import sign_crops
+from sign_images import BASE_DIR, SHEET_DIR, SheetStore
+
+CROPS_PATH = os.path.join(BASE_DIR, "sign_crops.py")
+
+# A pixel is foreground when its darkest channel is below this...
+DARK_THRESHOLD = 170
+# ...or its channels differ by more than this (red, blue, green, yellow signs)
+COLOUR_THRESHOLD = 60
+
+# Smallest sign edge in pixels; the file name captions under the signs are smaller
+MIN_SIGN_SIZE = 30
+# Largest sign edge in pixels; the dark window frame around a screenshot is larger
+MAX_SIGN_SIZE = 400
+
+# Caption of the first sign on each sheet, read off the screenshots. The last
+# row of the 3rd sheet (113-120) is repeated at the top of the 4th; the first
+# sheet that has a sign keeps it.
+PAGE_FIRST_SIGN = {
+    "1stSignPage.png": 1,
+    "2ndSignPage.png": 41,
+    "3rdSignPage.png": 81,
+    "4thSignPage.png": 113,
+}
+
+
+def foreground_mask(pixels):
+    """Returns a (height, width) bool array, True where an RGBA sheet is not background."""
+    red, green, blue = pixels[..., 0], pixels[..., 1], pixels[..., 2]
+    darkest = numpy.minimum(numpy.minimum(red, green), blue)
+    spread = numpy.maximum(numpy.maximum(red, green), blue) - darkest
+    return (darkest < DARK_THRESHOLD) | (spread > COLOUR_THRESHOLD)
+
+
+def _runs(mask):
+    """
+    Returns the horizontal runs of True in mask as arrays (row, start, end),
+    end exclusive, ordered by row and then start.
+    """
+    height, width = mask.shape
+    padded = numpy.zeros((height, width + 2), dtype=numpy.int8)
+    padded[:, 1:-1] = mask
+    edges = numpy.diff(padded, axis=1)
+    rows, starts = numpy.nonzero(edges == 1)
+    _, ends = numpy.nonzero(edges == -1)
+    return rows, starts, ends
+
+
+def label_components(mask):
+    """
+    Groups the 8-connected foreground pixels of mask into components.
+
+    Works on runs rather than pixels: two runs on neighbouring rows are joined
+    when they overlap or touch diagonally, and the run graph is collapsed by
+    min-label propagation with pointer jumping, all in array operations.
+    Returns the components' boxes as an (n, 4) array of (left, top, right, bottom).
+    """
+    rows, starts, ends = _runs(mask)
+    if len(rows) == 0:
+        return numpy.empty((0, 4), dtype=numpy.int64)
+
+    # Sort keys that put every run of row r before every run of row r + 1
+    stride = mask.shape[1] + 2
+    start_keys = rows * stride + starts
+    end_keys = rows * stride + ends
+
+    # For each run b on row r, the runs a on row r - 1 with a.start <= b.end and a.end >= b.start
+    above = (rows - 1) * stride
+    first = numpy.searchsorted(end_keys, above + starts, side="left")
+    last = numpy.searchsorted(start_keys, above + ends, side="right")
+    counts = numpy.maximum(last - first, 0)
+    lower = numpy.repeat(numpy.arange(len(rows)), counts)
+    upper = numpy.repeat(first, counts) + (numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts))
+
+    labels = numpy.arange(len(rows))
+    while True:
+        smallest = numpy.minimum(labels[lower], labels[upper])
+        merged = labels.copy()
+        numpy.minimum.at(merged, lower, smallest)
+        numpy.minimum.at(merged, upper, smallest)
+        merged = merged[merged]
+        if numpy.array_equal(merged, labels):
+            break
+        labels = merged
+
+    _, component = numpy.unique(labels, return_inverse=True)
+    count = component.max() + 1
+    boxes = numpy.empty((count, 4), dtype=numpy.int64)
+    boxes[:, :2] = numpy.iinfo(numpy.int64).max
+    boxes[:, 2:] = -1
+    numpy.minimum.at(boxes[:, 0], component, starts)
+    numpy.minimum.at(boxes[:, 1], component, rows)
+    numpy.maximum.at(boxes[:, 2], component, ends)
+    numpy.maximum.at(boxes[:, 3], component, rows + 1)
+    return boxes
+
+
+def _merge_overlapping(boxes):
+    """
+    Replaces every group of overlapping boxes by the box around the group, e.g.
+    the pieces of a sign whose border is cut through by a white symbol.
+    """
+    while len(boxes) > 1:
+        left, top, right, bottom = (boxes[:, i] for i in range(4))
+        overlaps = ((left[:, None] < right[None, :]) & (left[None, :] < right[:, None])
+                    & (top[:, None] < bottom[None, :]) & (top[None, :] < bottom[:, None]))
+        group = overlaps.argmax(axis=1)  # Lowest index each box overlaps, itself included
+        if numpy.array_equal(group, numpy.arange(len(boxes))):
+            break
+        _, group = numpy.unique(group, return_inverse=True)
+        merged = numpy.empty((group.max() + 1, 4), dtype=boxes.dtype)
+        merged[:, :2] = numpy.iinfo(boxes.dtype).max
+        merged[:, 2:] = numpy.iinfo(boxes.dtype).min
+        numpy.minimum.at(merged[:, 0], group, left)
+        numpy.minimum.at(merged[:, 1], group, top)
+        numpy.maximum.at(merged[:, 2], group, right)
+        numpy.maximum.at(merged[:, 3], group, bottom)
+        boxes = merged
+    return boxes
+
+
+def sign_boxes(boxes):
+    """Turns component boxes into one box per sign, in reading order."""
+    width = boxes[:, 2] - boxes[:, 0]
+    height = boxes[:, 3] - boxes[:, 1]
+    boxes = _merge_overlapping(boxes[numpy.maximum(width, height) <= MAX_SIGN_SIZE])
+    width = boxes[:, 2] - boxes[:, 0]
+    height = boxes[:, 3] - boxes[:, 1]
+    signs = boxes[(numpy.minimum(width, height) >= MIN_SIGN_SIZE) & (numpy.maximum(width, height) <= MAX_SIGN_SIZE)]
+
+    # Reading order: a sign starting above the bottom of a row's first sign is on that row
+    ordered = []
+    for box in signs[numpy.argsort(signs[:, 1], kind="stable")]:
+        if ordered and box[1] < ordered[-1][0][3]:
+            ordered[-1].append(box)
+        else:
+            ordered.append([box])
+    return [tuple(int(v) for v in box) for row in ordered for box in sorted(row, key=lambda b: b[0])]
+
+
+def detect(sheet_dir=SHEET_DIR, sheets=None):
+    """Returns {sign ID: (page, box)} for every sign found on the sheets."""
+    sheets = sheets or SheetStore(sheet_dir=sheet_dir)
+    detected = {}
+    for page, first in PAGE_FIRST_SIGN.items():
+        width, height = sheets.size(page)
+        pixels = sheets.crop(page, (0, 0, width, height))
+        for number, box in enumerate(sign_boxes(label_components(foreground_mask(pixels))), first):
+            detected.setdefault(f"sign{number}", (page, box))
+    return detected
+
+
+def overlap(a, b):
+    """Intersection over union of two boxes."""
+    width = min(a[2], b[2]) - max(a[0], b[0])
+    height = min(a[3], b[3]) - max(a[1], b[1])
+    if width <= 0 or height <= 0:
+        return 0.0
+    intersection = width * height
+    area = lambda box: (box[2] - box[0]) * (box[3] - box[1])
+    return intersection / (area(a) + area(b) - intersection)
+
+
+def diff(detected, table=None):
+    """Returns a list of report lines comparing detected boxes with a sign_crops table."""
+    table = sign_crops if table is None else table
+    lines = []
+    counts = {"same": 0, "moved": 0, "missing": 0, "new": 0}
+    number = lambda sign_id: int(sign_id[4:]) if sign_id[4:].isdigit() else 0
+    for sign_id in sorted(set(detected) | set(table), key=number):
+        if sign_id not in detected:
+            counts["missing"] += 1
+            lines.append(f"- {sign_id}: {table[sign_id]} not found on the sheets")
+        elif sign_id not in table:
+            counts["new"] += 1
+            lines.append(f"+ {sign_id}: {detected[sign_id]} not in sign_crops")
+        elif detected[sign_id][0] == table[sign_id][0] and overlap(detected[sign_id][1], table[sign_id][1]) >= 0.8:
+            counts["same"] += 1
+        else:
+            counts["moved"] += 1
+            score = overlap(detected[sign_id][1], table[sign_id][1]) if detected[sign_id][0] == table[sign_id][0] else 0
+            lines.append(f"~ {sign_id}: {table[sign_id]} -> {detected[sign_id]} (overlap {score:.2f})")
+    lines.append(", ".join(f"{count} {what}" for what, count in counts.items()))
+    return lines
+
+
+def format_table(detected):
+    """Returns detected as the source of sign_crops.py."""
+    lines = [
+        "# sign_crops.py",
+        "# Generated by detect_signs.py from the screenshots in Images/.",
+        "# Each entry is in the format:",
+        '# "unique_sign_id": ("WhichPage.png", (left, top, right, bottom))',
+        "",
+        "sign_crops = {",
+    ]
+    width = max(len(sign_id) for sign_id in detected) + 3
+    for sign_id, (page, box) in detected.items():
+        key = f'"{sign_id}":'
+        lines.append(f'    {key:<{width}} ("{page}", {box}),')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def write_table(detected, path=CROPS_PATH):
+    """Replaces the sign_crops table at path with detected."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(format_table(detected))
+    os.replace(tmp_path, path)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] not in (["diff"], ["write"]):
+        print("usage: python detect_signs.py diff|write")
+        sys.exit(2)
+    started = time.perf_counter()
+    found = detect()
+    elapsed = time.perf_counter() - started
+    print("\n".join(diff(found)))
+    pages = len({page for page, _ in found.values()})
+    print(f"{len(found)} signs on {pages} pages in {elapsed * 1000:.0f} ms")
+    if sys.argv[1] == "write":
+        write_table(found)
+        print(f"Wrote {CROPS_PATH}")
@@ -0,0 +1,636 @@
+# question_bank.py
+# Compiles the pools in question_pools.py into a versioned JSON artifact and
+# loads that artifact back once per process, so starting a new quiz no longer
+# rebuilds ~220 question literals. The loaded questions are served through a
+# single QuestionBank (see get_bank()), which BankWatcher swaps for a new one
+# when question_pools.py is edited while the quiz is running.
+#
+# Build (or rebuild) the artifact with:
+#     python question_bank.py build
+
+import abc
+import ast
+import hashlib
+import json
+import os
+import random
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from sign_images import cached_sign_path, sign_id_for
+
+# Bump whenever the layout of question_bank.json changes
+BANK_FORMAT_VERSION = 2
+
+BANK_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(BANK_DIR, "question_pools.py")
+ARTIFACT_PATH = os.path.join(BANK_DIR, "question_bank.json")
+
+POOL_NAMES = ("sign_pool", "safety_pool", "law_pool")
+
+# Category names, in pool order. Questions store the position, not the string.
+CATEGORIES = ("Signs", "Safety", "Law")
+SIGNS, SAFETY, LAW = range(len(CATEGORIES))
+
+# The real exam: 10 questions from each category
+EXAM_BLUEPRINT = {"Signs": 10, "Safety": 10, "Law": 10}
+
+# Answers every question offers; the quiz screen has a row for each
+OPTION_COUNT = 3
+
+# Parsed pools, filled in by the first load_pools() call
+_pools = None
+
+# Process-wide QuestionBank, filled in by the first get_bank() call
+_bank = None
+
+# Image path -> absolute path (or None when missing), so each image is looked up once
+_asset_paths = {}
+
+MANIFEST_PATH = os.path.join(BANK_DIR, "asset_manifest.json")
+
+
+def source_hash(path=SOURCE_PATH):
+    """Returns the SHA-256 of the pool source file."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def compile_pools(path=SOURCE_PATH):
+    """Executes the pool source file and returns its pools by name."""
+    with open(path, encoding="utf-8") as f:
+        code = compile(f.read(), path, "exec")
+    namespace = {}
+    exec(code, namespace)
+    return {name: namespace[name] for name in POOL_NAMES}
+
+
+def build_artifact(source=SOURCE_PATH, artifact=ARTIFACT_PATH):
+    """Compiles the pools and writes them to the artifact. Returns the artifact data."""
+    data = {
+        "format": BANK_FORMAT_VERSION,
+        "source_hash": source_hash(source),
+        "pools": compile_pools(source),
+    }
+
+    # Write to a temporary file first so a running quiz never reads half a file
+    tmp_path = artifact + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, artifact)
+    return data
+
+
+def read_artifact(artifact=ARTIFACT_PATH):
+    """Returns the parsed artifact, or None if it is missing, unreadable or of another format."""
+    try:
+        with open(artifact, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("format") != BANK_FORMAT_VERSION:
+        return None
+    return data
+
+
+def load_pools(reload=False):
+    """
+    Returns the question pools as a dict {pool name: list of question dicts}.
+
+    The artifact is parsed at most once per process. If it is missing, from an
+    older format, or out of date with question_pools.py, it is rebuilt first.
+    The returned lists are shared: callers must not modify them.
+    """
+    global _pools
+    if _pools is None or reload:
+        data = read_artifact()
+        # The source file is optional on deployed kiosks, the artifact is enough
+        if os.path.exists(SOURCE_PATH) and (data is None or data["source_hash"] != source_hash()):
+            try:
+                data = build_artifact()
+            except OSError:
+                # Read-only install: keep working from the source
+                data = {"pools": compile_pools()}
+        if data is None:
+            raise FileNotFoundError(f"No question bank found at {ARTIFACT_PATH}")
+        _pools = data["pools"]
+    return _pools
+
+
+class BankValidationError(ValueError):
+    """Raised when the question pools fail validation. problems lists every issue found."""
+
+    def __init__(self, problems):
+        super().__init__("Invalid question bank:\n  " + "\n  ".join(problems))
+        self.problems = problems
+
+
+def validate_pools(pools, blueprint=EXAM_BLUEPRINT):
+    """
+    Checks the pools once at load time and returns a list of problems (empty if valid):
+    unknown categories, questions without OPTION_COUNT options, answers that
+    are not the index of an option, duplicate IDs, and categories with fewer
+    questions than the blueprint asks for.
+    """
+    problems = []
+    seen_ids = set()
+    counts = dict.fromkeys(CATEGORIES, 0)
+    for name in POOL_NAMES:
+        for position, entry in enumerate(pools[name]):
+            where = f"{name}[{position}] (ID {entry.get('id')})"
+            if entry.get("id") in seen_ids:
+                problems.append(f"{where}: duplicate ID")
+            seen_ids.add(entry.get("id"))
+            if entry.get("category") not in counts:
+                problems.append(f"{where}: unknown category {entry.get('category')!r}")
+            else:
+                counts[entry["category"]] += 1
+            options = entry.get("options")
+            if not isinstance(options, list) or len(options) != OPTION_COUNT:
+                problems.append(f"{where}: needs a list of {OPTION_COUNT} options")
+            correct = entry.get("correct")
+            # bool is an int too, but True is no answer index
+            if type(correct) is not int or not 0 <= correct < OPTION_COUNT:
+                problems.append(f"{where}: correct answer {correct!r} is not one of its options")
+
+    for category, needed in blueprint.items():
+        if counts.get(category, 0) < needed:
+            problems.append(f"only {counts.get(category, 0)} '{category}' questions, the exam needs {needed}")
+    return problems
+
+
+def resolve_asset(image, base_dir=BANK_DIR):
+    """
+    Returns the absolute path of an image path from the pools, or None if it is unset or missing.
+    Sign images that are not on disk fall back to their crop from the sign sheets (see sign_images.py).
+    """
+    if not image:
+        return None
+    if image not in _asset_paths:
+        path = os.path.join(base_dir, image)
+        if not os.path.exists(path):
+            path = cached_sign_path(sign_id_for(image))
+        _asset_paths[image] = path
+    return _asset_paths[image]
+
+
+def build_manifest(questions):
+    """Returns the asset manifest {question ID: absolute image path or None}."""
+    return {q.id: resolve_asset(q.image) for q in questions}
+
+
+def missing_images(bank):
+    """
+    Returns a line for every question bank owns whose image did not resolve
+    (neither on disk nor in the sign crop cache). Reported as warnings when the
+    bank loads: the question still works, just without its picture.
+    """
+    return [
+        f"question {q.id}: image {q.image!r} not found"
+        for q in bank.questions if q.image and not bank.manifest[q.id]
+    ]
+
+
+class OptionTable:
+    """
+    Append-only table of answer texts shared by every question.
+
+    Each distinct text is stored once (and interned), questions refer to it by
+    its position. Positions never change, so two answers are equal exactly when
+    their positions are, and banks built at different times can share the table.
+    """
+
+    def __init__(self):
+        self.texts = []
+        self.index = {}
+
+    def __len__(self):
+        return len(self.texts)
+
+    def add(self, text):
+        """Returns the position of text, adding it to the table if needed."""
+        position = self.index.get(text)
+        if position is None:
+            position = len(self.texts)
+            text = sys.intern(text)
+            self.texts.append(text)
+            self.index[text] = position
+        return position
+
+
+# The process-wide answer table used by every Question
+option_table = OptionTable()
+
+
+class Question:
+    """
+    One exam question. Uses __slots__ instead of a dict per question, keeps the
+    category as an index into CATEGORIES and the answers as positions in
+    option_table.
+    """
+
+    __slots__ = ("id", "text", "option_ids", "correct", "category", "image")
+
+    def __init__(self, question_id, text, option_ids, correct, category, image=None):
+        self.id = question_id
+        self.text = text
+        self.option_ids = option_ids
+        self.correct = correct
+        self.category = category
+        self.image = image
+
+    @classmethod
+    def from_dict(cls, entry):
+        """Builds a Question from an entry in the question_pools.py format."""
+        return cls(
+            entry["id"],
+            entry["question"],
+            tuple(option_table.add(text) for text in entry["options"]),
+            entry["correct"],
+            CATEGORIES.index(entry["category"]),
+            entry["image"],
+        )
+
+    @property
+    def options(self):
+        """The answer texts, in display order."""
+        texts = option_table.texts
+        return tuple(texts[option_id] for option_id in self.option_ids)
+
+    @property
+    def category_name(self):
+        return CATEGORIES[self.category]
+
+    def __repr__(self):
+        return f"Question(id={self.id}, category={self.category_name!r})"
+
+
+class QuestionStore(abc.ABC):
+    """
+    Where exams are drawn from. The in-memory QuestionBank is the default;
+    question_store.SQLiteQuestionStore serves banks too large to keep in memory.
+    """
+
+    @abc.abstractmethod
+    def sample_ids(self, blueprint, rng=random):
+        """
+        Returns the IDs of a shuffled exam with blueprint[category] questions from each category.
+
+        blueprint maps category names to counts (e.g. EXAM_BLUEPRINT), rng is a
+        random.Random-like object.
+        """
+
+    @abc.abstractmethod
+    def resolve(self, question_ids):
+        """Returns the Questions for a list of IDs, in the same order."""
+
+    def sample(self, blueprint, rng=random):
+        """
+        Same as sample_ids(), but returns the Question objects themselves.
+        They may be shared with the store and must not be modified.
+        """
+        return self.resolve(self.sample_ids(blueprint, rng))
+
+    def asset_path(self, question):
+        """Returns the absolute path of question's image, or None if it has none or it is missing."""
+        return resolve_asset(question.image)
+
+
+class QuestionBank(QuestionStore):
+    """
+    An immutable, numbered version of the question bank.
+
+    The first version owns every question. A version made with derive() owns
+    only the questions added or changed since its parent, plus the set of IDs
+    it removed, and looks everything else up in the parent. Unchanged Question
+    objects and category arrays are shared, so each version costs memory in
+    proportion to what changed, and an exam can stay on the version it was
+    drawn from for as long as it likes.
+
+    Each version keeps the questions it owns in self.questions (by_id maps
+    their IDs to them) and manifest maps their IDs to resolved image paths
+    (see build_manifest()).
+
+    by_category holds an array of question IDs per category. Drawing an exam only
+    picks positions from those arrays, so the bank is never copied and the cost
+    of an exam depends on its length, not the bank size.
+    """
+
+    # Chains of versions longer than this are folded together so lookups stay short
+    MAX_DEPTH = 8
+
+    def __init__(self, questions, parent=None, removed=(), version=1):
+        self.version = version
+        self.parent = parent
+        self.depth = parent.depth + 1 if parent is not None else 0
+        self.removed = frozenset(removed)
+        self.questions = list(questions)
+        self.by_id = {}
+        for q in self.questions:
+            if q.id in self.by_id:
+                raise ValueError(f"Duplicate question ID {q.id}")
+            self.by_id[q.id] = q
+        self.manifest = build_manifest(self.questions)
+        self.by_category = self._index_categories()
+
+    @classmethod
+    def from_pools(cls, pools):
+        """Builds a first version from pools in the question_pools.py format."""
+        return cls(Question.from_dict(entry) for name in POOL_NAMES for entry in pools[name])
+
+    def _index_categories(self):
+        """Returns the per-category ID arrays, reusing the parent's for categories that kept their members."""
+        if self.parent is None:
+            by_category = {}
+            for q in self.questions:
+                by_category.setdefault(q.category_name, array("I")).append(q.id)
+            return by_category
+
+        added = {}
+        dropped = {}
+        for q in self.questions:
+            old = self.parent.get(q.id)
+            if old is None or old.category != q.category:
+                added.setdefault(q.category_name, []).append(q.id)
+            if old is not None and old.category != q.category:
+                dropped.setdefault(old.category_name, set()).add(q.id)
+        for question_id in self.removed:
+            old = self.parent.get(question_id)
+            if old is not None:
+                dropped.setdefault(old.category_name, set()).add(question_id)
+
+        by_category = dict(self.parent.by_category)
+        for name in set(added) | set(dropped):
+            gone = dropped.get(name, ())
+            ids = array("I", (i for i in by_category.get(name, ()) if i not in gone))
+            ids.extend(added.get(name, ()))
+            by_category[name] = ids
+        return by_category
+
+    def derive(self, questions, removed=()):
+        """
+        Returns the next version: questions are added or replace the ones with the
+        same ID, and the IDs in removed are dropped. This version is left as it is.
+        """
+        if self.depth + 1 < self.MAX_DEPTH:
+            return QuestionBank(questions, parent=self, removed=removed, version=self.version + 1)
+
+        # Chain too long: fold every version above the first one into a single layer
+        base = self
+        while base.parent is not None:
+            base = base.parent
+        changes = {}
+        dropped = set(removed)
+        for q in questions:
+            changes[q.id] = q
+        layer = self
+        while layer is not base:
+            for q in layer.questions:
+                if q.id not in changes and q.id not in dropped:
+                    changes[q.id] = q
+            dropped.update(i for i in layer.removed if i not in changes)
+            layer = layer.parent
+
+        if len(changes) + len(dropped) <= len(base) // 2:
+            dropped = {i for i in dropped if i in base.by_id}
+            return QuestionBank(changes.values(), parent=base, removed=dropped, version=self.version + 1)
+
+        # Most of the bank has changed: start a new first version, still sharing the Question objects
+        merged = {q.id: q for q in self.all_questions()}
+        for question_id in removed:
+            merged.pop(question_id, None)
+        merged.update((q.id, q) for q in questions)
+        return QuestionBank(merged.values(), version=self.version + 1)
+
+    def _owner(self, question_id):
+        """Returns the version that holds question_id for this version, or None if it has no such question."""
+        layer = self
+        while layer is not None:
+            if question_id in layer.by_id:
+                return layer
+            if question_id in layer.removed:
+                return None
+            layer = layer.parent
+        return None
+
+    def __len__(self):
+        return sum(len(ids) for ids in self.by_category.values())
+
+    def __contains__(self, question_id):
+        return self._owner(question_id) is not None
+
+    def asset_path(self, question):
+        layer = self._owner(question.id)
+        if layer is None or layer.by_id[question.id] is not question:
+            return resolve_asset(question.image)  # A question from another version
+        return layer.manifest.get(question.id)
+
+    def get(self, question_id):
+        """Returns the question with the given ID, or None if this version has none."""
+        layer = self._owner(question_id)
+        return layer.by_id[question_id] if layer is not None else None
+
+    def resolve(self, question_ids):
+        questions = []
+        for question_id in question_ids:
+            q = self.get(question_id)
+            if q is None:
+                raise KeyError(f"No question {question_id} in version {self.version} of the bank")
+            questions.append(q)
+        return questions
+
+    def all_questions(self):
+        """Returns every question of this version, category by category."""
+        return [self.get(question_id) for name in CATEGORIES for question_id in self.by_category.get(name, ())]
+
+    def sample_ids(self, blueprint, rng=random):
+        exam = []
+        for category, count in blueprint.items():
+            ids = self.by_category.get(category, ())
+            if len(ids) < count:
+                raise ValueError(f"Only {len(ids)} '{category}' questions in the bank, {count} needed")
+
+            # Sampling positions from a range is O(count) for large categories
+            exam.extend(ids[pick] for pick in rng.sample(range(len(ids)), count))
+
+        rng.shuffle(exam)
+        return exam
+
+
+def get_bank():
+    """
+    Returns the process-wide QuestionBank, building it on first use.
+    Raises BankValidationError if the pools do not pass validate_pools(), and
+    prints a warning for every sign image that did not resolve.
+    """
+    global _bank
+    if _bank is None:
+        pools = load_pools()
+        problems = validate_pools(pools)
+        if problems:
+            raise BankValidationError(problems)
+        _bank = QuestionBank.from_pools(pools)
+        for line in missing_images(_bank):
+            print(f"Warning: {line}")
+    return _bank
+
+
+def set_bank(bank):
+    """Makes bank the one get_bank() returns from now on. Exams already drawn keep theirs."""
+    global _bank
+    _bank = bank
+
+
+def pool_entries(source):
+    """Yields (pool name, source text) for every entry of the pools in question_pools.py source."""
+    lines = source.splitlines(keepends=True)
+    line_starts = [0]
+    for line in lines:
+        line_starts.append(line_starts[-1] + len(line))
+
+    def offset(lineno, col):
+        # ast columns are UTF-8 byte offsets
+        return line_starts[lineno - 1] + len(lines[lineno - 1].encode("utf-8")[:col].decode("utf-8"))
+
+    # ast.get_source_segment() re-splits the whole file on every call, this does it once
+    for node in ast.parse(source).body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name) and node.targets[0].id in POOL_NAMES
+                and isinstance(node.value, ast.List)):
+            for element in node.value.elts:
+                start = offset(element.lineno, element.col_offset)
+                end = offset(element.end_lineno, element.end_col_offset)
+                yield node.targets[0].id, source[start:end]
+
+
+class BankWatcher:
+    """
+    Reloads the question bank when question_pools.py changes.
+
+    poll() is meant to be called from the Tk loop every second or so: it only
+    stats the file, and hands any re-parse to a worker thread so the UI never
+    waits on it. Entries are cached by their source text, so a reload only
+    re-parses (and rebuilds Questions for) the entries that actually changed,
+    and the new bank is a QuestionBank.derive() of the running one.
+    """
+
+    def __init__(self, bank, path=SOURCE_PATH):
+        self.path = path
+        self.bank = bank
+        self._stamp = self._stat()
+        self._hash = None
+        # Entry source text -> [entry dict, Question or None until the entry is first used]
+        self._entries = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bank-reload")
+        # Parse the current file once up front so the first edit is already incremental
+        self._pending = self._executor.submit(self._reload)
+
+    def _stat(self):
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def poll(self):
+        """
+        Returns the new QuestionBank if a reload finished since the last call (it is
+        also installed with set_bank()), otherwise None.
+        """
+        if self._pending is not None:
+            if not self._pending.done():
+                return None
+            future, self._pending = self._pending, None
+            bank = future.result()
+            if bank is None:
+                return None
+            self.bank = bank
+            set_bank(bank)
+            return bank
+
+        try:
+            stamp = self._stat()
+        except OSError:
+            return None
+        if stamp != self._stamp:
+            self._stamp = stamp
+            self._pending = self._executor.submit(self._reload)
+        return None
+
+    def _reload(self):
+        """Runs on the worker thread. Returns a new bank, or None if nothing changed or the file is broken."""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+            if digest == self._hash:
+                return None  # Touched but not changed
+            source = data.decode("utf-8")
+
+            entries = {}
+            pools = {name: [] for name in POOL_NAMES}
+            for name, text in pool_entries(source):
+                cached = self._entries.get(text)
+                if cached is None:
+                    cached = [ast.literal_eval(text), None]
+                entries[text] = cached
+                pools[name].append(cached[0])
+        except (OSError, SyntaxError, ValueError) as e:
+            print(f"Question bank not reloaded: {e}")
+            return None
+
+        problems = validate_pools(pools)
+        if problems:
+            print(BankValidationError(problems))
+            return None
+
+        questions = []
+        for cached in entries.values():
+            if cached[1] is None:
+                # Unchanged entries keep the Question object of the running bank
+                new = Question.from_dict(cached[0])
+                current = self.bank.get(new.id)
+                cached[1] = current if current is not None and _same_question(current, new) else new
+            questions.append(cached[1])
+
+        # The next version only records what differs from the running one
+        changed = [q for q in questions if self.bank.get(q.id) is not q]
+        kept = {q.id for q in questions}
+        removed = [q.id for q in self.bank.all_questions() if q.id not in kept]
+
+        self._entries = entries
+        self._hash = digest
+        if not changed and not removed:
+            return None  # Same questions as the running bank (e.g. the first parse)
+        bank = self.bank.derive(changed, removed)
+        print(f"Question bank reloaded as version {bank.version} ({len(changed)} changed, {len(removed)} removed)")
+        for line in missing_images(bank):
+            print(f"Warning: {line}")
+        return bank
+
+
+def _same_question(a, b):
+    return all(getattr(a, field) == getattr(b, field) for field in Question.__slots__)
+
+
+def write_manifest(bank, path=MANIFEST_PATH):
+    """Writes bank.manifest as JSON, for inspecting which images resolved."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({str(question_id): asset for question_id, asset in bank.manifest.items()}, f, indent=1)
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) == 2 else None
+    if command == "build":
+        built = build_artifact()
+        counts = ", ".join(f"{name}: {len(built['pools'][name])}" for name in POOL_NAMES)
+        print(f"Wrote {ARTIFACT_PATH} (format {BANK_FORMAT_VERSION}; {counts})")
+    elif command == "validate":
+        try:
+            checked = get_bank()
+        except BankValidationError as e:
+            print(e)
+            sys.exit(1)
+        write_manifest(checked)
+        print(f"{len(checked)} questions OK, {len(missing_images(checked))} images missing; wrote {MANIFEST_PATH}")
+    else:
+        print("usage: python question_bank.py build|validate")
+        sys.exit(2)
@@ -0,0 +1,180 @@
+# question_cards.py
+# The question card of the quiz screen, double-buffered.
+#
+# The quiz screen stacks two QuestionCards in the same grid cell. The one on
+# top shows the current question; while it is being read, the one underneath
+# is filled in with the next question, sign image included. "Next Question"
+# then only has to raise the card underneath, so the click costs one repaint
+# instead of a round of config() calls and an image swap.
+
+import tkinter as tk
+
+from question_bank import OPTION_COUNT, SIGNS
+
+# Milliseconds between raising a card and preparing the next question underneath it,
+# so Tk paints the raised card before anything else is laid out
+PREPARE_DELAY = 50
+
+# Wrap width of the option texts, and the room the sign image takes beside them
+OPTION_WRAP = 850
+IMAGE_SIZE = 300
+IMAGE_GAP = 20
+
+
+class QuestionCard:
+    """One question card's widgets, filled in by show() for any question."""
+
+    def __init__(self, parent, app, slot):
+        self.app = app
+        self.slot = slot  # PhotoManager slot of this card's image
+        # (index in the exam, question) the card is filled in with, None before show()
+        self.showing = None
+        colors = app.colors
+
+        # Question card with shadow effect
+        self.frame = tk.Frame(
+            parent,
+            bg=colors["card_bg"],
+            highlightbackground=colors["border"],
+            highlightthickness=1,
+            padx=25,
+            pady=25
+        )
+        self.frame.grid(row=0, column=0, sticky="nsew")
+
+        # Category label
+        self.category_label = tk.Label(
+            self.frame,
+            text="Category: Signs",
+            font=app.fonts["small"],
+            bg=colors["card_bg"],
+            fg=colors["light_text"]
+        )
+        self.category_label.pack(anchor="w")
+
+        # Question text
+        self.question_label = tk.Label(
+            self.frame,
+            text="",
+            font=app.fonts["subheading"],
+            wraplength=900,
+            justify="left",
+            bg=colors["card_bg"],
+            fg=colors["text"]
+        )
+        self.question_label.pack(pady=(10, 20), anchor="w")
+
+        # Sign image and options side by side: a 300 px sign above the options would make
+        # the card taller than the space the quiz screen has for it
+        body_frame = tk.Frame(self.frame, bg=colors["card_bg"])
+        body_frame.pack(fill="x", pady=(0, 20))
+
+        # Image label (for sign images), only packed while the card shows a sign
+        self.image_label = tk.Label(body_frame, bg=colors["card_bg"])
+
+        # Options frame
+        self.options_frame = options_frame = tk.Frame(body_frame, bg=colors["card_bg"])
+        options_frame.pack(side="left", fill="x", expand=True, anchor="n")
+
+        # Custom radio buttons with modern styling, all on the app's selection variable
+        self.radio_buttons = []
+        for i in range(OPTION_COUNT):
+            option_frame = tk.Frame(
+                options_frame,
+                bg=colors["card_bg"],
+                highlightbackground=colors["border"],
+                highlightthickness=1,
+                padx=15,
+                pady=15,
+                cursor="hand2"  # Hand cursor to indicate clickable
+            )
+            option_frame.pack(fill="x", pady=8)
+
+            # Store the option index for click events
+            option_frame.option_index = i
+
+            # Bind click event to the entire frame
+            option_frame.bind("<Button-1>", app.option_frame_clicked)
+
+            rb = tk.Radiobutton(
+                option_frame,
+                variable=app.var,
+                value=i,
+                bg=colors["card_bg"],
+                activebackground=colors["card_bg"],
+                fg=colors["text"],
+                selectcolor=colors["card_bg"]
+            )
+            rb.pack(side="left", padx=(0, 10))
+
+            # Also bind the radiobutton to update the parent frame
+            rb.bind("<Button-1>", lambda event, idx=i: app.option_frame_clicked(event, idx))
+
+            option_text = tk.Label(
+                option_frame,
+                text="Option text goes here",
+                font=app.fonts["body"],
+                wraplength=OPTION_WRAP,
+                justify="left",
+                bg=colors["card_bg"],
+                fg=colors["text"],
+                cursor="hand2"  # Hand cursor to indicate clickable
+            )
+            option_text.pack(side="left", fill="x", expand=True)
+
+            # Also bind the label to update the parent frame
+            option_text.bind("<Button-1>", lambda event, idx=i: app.option_frame_clicked(event, idx))
+
+            self.radio_buttons.append((rb, option_text, option_frame))
+
+    def shows(self, index, q):
+        """True when the card is already filled in with question q as question index of the exam."""
+        return self.showing is not None and self.showing[0] == index and self.showing[1] is q
+
+    def show(self, index, q):
+        """Fills the card with question q, question index of the exam, no option highlighted."""
+        app = self.app
+        colors = app.colors
+
+        # Update category
+        self.category_label.config(text=f"Category: {q.category_name}")
+
+        # Reset option styling - both frame border and text color
+        for rb, label, frame in self.radio_buttons:
+            frame.config(highlightbackground=colors["border"])
+            label.config(fg=colors["text"])
+
+        # Show question text
+        self.question_label.config(text=q.text)
+
+        # Show sign image if category is "Signs" and its image resolved when the bank loaded
+        image_path = app.store.asset_path(q) if q.category == SIGNS else None
+        if image_path:
+            try:
+                # Decoded and resized (maintaining aspect ratio) once, then served from the cache
+                photo = app.image_cache.photo(image_path, IMAGE_SIZE)
+                app.photos.show(self.slot, photo)  # store reference
+                self.image_label.config(image=photo, text="")
+            except Exception as e:
+                self.image_label.config(image="", text=f"Error loading image")
+                app.photos.release(self.slot)
+                print(f"Image error: {e}")
+            self.image_label.pack(side="left", anchor="n", padx=(0, IMAGE_GAP), before=self.options_frame)
+            wrap = OPTION_WRAP - IMAGE_SIZE - IMAGE_GAP
+        else:
+            # No image for this question (or it is missing)
+            self.image_label.config(image="", text="")
+            self.image_label.pack_forget()
+            app.photos.release(self.slot)
+            wrap = OPTION_WRAP
+
+        # Update the radio button text, narrower beside a sign
+        for i, (rb, label, frame) in enumerate(self.radio_buttons):
+            label.config(text=q.options[i], wraplength=wrap)
+
+        self.showing = (index, q)
+
+    def release(self):
+        """Unpins the card's image; the card has to be shown again before it is raised."""
+        self.app.photos.release(self.slot)
+        self.showing = None
@@ -0,0 +1,197 @@
+# question_store.py
+# Optional SQLite back end for the question bank. Only the questions of the
+# current exam are ever loaded, so banks of 100k+ questions keep memory flat.
+#
+# Export the current sign_pool/safety_pool/law_pool into a database with:
+#     python question_store.py migrate questions.db
+# and start the quiz on it with:
+#     python DrivingLicenseTester.py --db questions.db
+
+import os
+import random
+import sqlite3
+import sys
+
+from question_bank import CATEGORIES, Question, QuestionStore, get_bank, option_table
+from sign_images import sign_id_for
+
+# Bump whenever the schema below changes
+STORE_FORMAT_VERSION = 1
+
+# Questions are numbered 0..n-1 inside each (category, difficulty) group, so a
+# random draw is k lookups on the unique index instead of ORDER BY random().
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE options (
+    id INTEGER PRIMARY KEY,
+    text TEXT NOT NULL UNIQUE
+);
+CREATE TABLE questions (
+    id INTEGER PRIMARY KEY,
+    category INTEGER NOT NULL,
+    difficulty INTEGER NOT NULL DEFAULT 0,
+    position INTEGER NOT NULL,
+    sign_id TEXT,
+    text TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    image TEXT
+);
+CREATE TABLE question_options (
+    question_id INTEGER NOT NULL REFERENCES questions(id),
+    slot INTEGER NOT NULL,
+    option_id INTEGER NOT NULL REFERENCES options(id),
+    PRIMARY KEY (question_id, slot)
+) WITHOUT ROWID;
+CREATE UNIQUE INDEX questions_by_category ON questions (category, difficulty, position);
+CREATE INDEX questions_by_difficulty ON questions (difficulty);
+CREATE INDEX questions_by_sign ON questions (sign_id);
+"""
+
+
+class StoredQuestion(Question):
+    """
+    A Question from a SQLiteQuestionStore. It carries its own answer texts, and
+    its option_ids are IDs in the database's options table, not positions in
+    the process-wide option_table: that table never shrinks, and would
+    otherwise grow with every exam drawn until it held the whole store.
+    """
+
+    __slots__ = ("options",)
+
+    def __init__(self, question_id, text, option_ids, correct, category, image, options):
+        super().__init__(question_id, text, option_ids, correct, category, image)
+        self.options = options
+
+
+class SQLiteQuestionStore(QuestionStore):
+    """
+    QuestionStore backed by a database written by migrate().
+
+    difficulty, if given, restricts draws to questions with one of those
+    difficulty levels.
+    """
+
+    def __init__(self, path, difficulty=None):
+        self.path = path
+        # sqlite3.connect() would create a missing file, leaving an empty database behind a mistyped path
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"No question store at {path}")
+        self.connection = sqlite3.connect(path)
+        try:
+            version = self.connection.execute("SELECT value FROM meta WHERE key = 'format'").fetchone()
+        except sqlite3.DatabaseError:
+            version = None  # Not a database, or one without the meta table
+        if version is None or int(version[0]) != STORE_FORMAT_VERSION:
+            self.connection.close()
+            raise ValueError(f"{path} is not a question store of format {STORE_FORMAT_VERSION}")
+
+        # Group sizes, per category: [(difficulty, count), ...]. A few rows however large the bank.
+        self.groups = {}
+        query = "SELECT category, difficulty, COUNT(*) FROM questions GROUP BY category, difficulty"
+        for category, level, count in self.connection.execute(query):
+            if difficulty is None or level in difficulty:
+                self.groups.setdefault(CATEGORIES[category], []).append((level, count))
+
+    def close(self):
+        self.connection.close()
+
+    def __len__(self):
+        return sum(count for groups in self.groups.values() for _, count in groups)
+
+    def sample_ids(self, blueprint, rng=random):
+        exam = []
+        for category, count in blueprint.items():
+            groups = self.groups.get(category, ())
+            total = sum(size for _, size in groups)
+
+            if total < count:
+                raise ValueError(f"Only {total} '{category}' questions in the store, {count} needed")
+
+            picks = rng.sample(range(total), count)
+
+            exam.extend(self._ids_at(CATEGORIES.index(category), groups, picks))
+
+        rng.shuffle(exam)
+        return exam
+
+    def _ids_at(self, category, groups, picks):
+        """Maps positions across a category's difficulty groups to question IDs."""
+        ids = []
+        for pick in picks:
+            for level, size in groups:
+                if pick < size:
+                    break
+                pick -= size
+            row = self.connection.execute(
+                "SELECT id FROM questions WHERE category = ? AND difficulty = ? AND position = ?",
+                (category, level, pick),
+            ).fetchone()
+            ids.append(row[0])
+        return ids
+
+    def resolve(self, question_ids):
+        placeholders = ",".join("?" * len(question_ids))
+        rows = self.connection.execute(
+            f"SELECT id, text, correct, category, image FROM questions WHERE id IN ({placeholders})",
+            question_ids,
+        ).fetchall()
+        options = {}
+        for question_id, option_id, text in self.connection.execute(
+            "SELECT qo.question_id, o.id, o.text FROM question_options qo JOIN options o ON o.id = qo.option_id"
+            f" WHERE qo.question_id IN ({placeholders}) ORDER BY qo.question_id, qo.slot",
+            question_ids,
+        ):
+            options.setdefault(question_id, []).append((option_id, text))
+
+        by_id = {}
+        for question_id, text, correct, category, image in rows:
+            option_ids, texts = zip(*options[question_id])
+            by_id[question_id] = StoredQuestion(question_id, text, option_ids, correct, category, image, texts)
+        return [by_id[question_id] for question_id in question_ids]
+
+
+def migrate(path, bank=None):
+    """Writes every question of bank (default: the loaded question pools) into a new store at path."""
+    bank = bank if bank is not None else get_bank()
+    if os.path.exists(path):
+        raise FileExistsError(f"{path} already exists")
+
+    connection = sqlite3.connect(path)
+    try:
+        with connection:
+            connection.executescript(SCHEMA)
+            connection.execute("INSERT INTO meta VALUES ('format', ?)", (str(STORE_FORMAT_VERSION),))
+
+            # Option IDs in the store are the positions in the shared option table
+            connection.executemany(
+                "INSERT INTO options VALUES (?, ?)",
+                enumerate(option_table.texts),
+            )
+
+            positions = {}
+            for q in bank.all_questions():
+                difficulty = 0  # The current pools carry no difficulty, everything starts at 0
+                position = positions.get((q.category, difficulty), 0)
+                positions[(q.category, difficulty)] = position + 1
+                connection.execute(
+                    "INSERT INTO questions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (q.id, q.category, difficulty, position, sign_id_for(q.image), q.text, q.correct, q.image),
+                )
+                connection.executemany(
+                    "INSERT INTO question_options VALUES (?, ?, ?)",
+                    [(q.id, slot, option_id) for slot, option_id in enumerate(q.option_ids)],
+                )
+    finally:
+        connection.close()
+    return len(bank)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "migrate":
+        print("usage: python question_store.py migrate <database path>")
+        sys.exit(2)
+    count = migrate(sys.argv[2])
+    print(f"Wrote {count} questions to {sys.argv[2]}")
@@ -0,0 +1,542 @@
+# review_views.py
+# The "Questions Review" list on the results screen.
+#
+# ReviewList only creates widgets for the cards that are scrolled into view:
+# each ReviewCard is a full card (header, status, question, image, options)
+# built once and then refilled with whichever question scrolls into its place,
+# so a 100-question exam costs the same handful of cards as a 30-question one.
+#
+# CanvasReviewList is the other way round: no widgets at all, every card is
+# drawn as text, rectangle and image items on the canvas, with the text wrapped
+# here from the fonts' measurements so each card's height is known up front.
+#
+# Either list is made once with the results screen and clear()ed before the
+# next exam's review goes in.
+#
+# REVIEW_VIEWS maps the names accepted by --review to the two.
+
+import tkinter as tk
+from tkinter import font as tkfont
+from tkinter import ttk
+
+from question_bank import SIGNS
+
+# Space around and between the cards (the old inner frame's padding and the cards' pady)
+LIST_PADDING = 20
+CARD_GAP = 20
+
+# Heights assumed for cards that have not been laid out yet, without and with a sign image
+ESTIMATED_CARD_HEIGHT = 250
+ESTIMATED_IMAGE_HEIGHT = 160
+
+# Cards kept ready above and below the visible part, so slow scrolling never shows a gap
+OVERSCAN = 1
+
+# Entries added per batch while the results screen streams its review in, and the
+# milliseconds between batches. The batches are timer callbacks, not idle ones, so
+# update_idletasks() never runs one in the middle of a refresh; and the delay is not
+# 0 because Tk runs timers that are due before any idle work, painting included.
+REVIEW_BATCH = 5
+REVIEW_BATCH_DELAY = 1
+
+# Inside of a drawn card: the widget card's padx/pady plus its 1 pixel border
+CARD_PADDING = 16
+# Width text wraps at, as the widget cards' wraplength
+WRAP_WIDTH = 800
+
+
+def wrap_text(font, text, width, widths=None):
+    """
+    Breaks text into lines no wider than width pixels in font, at spaces where
+    possible, like a Label's wraplength. widths caches word widths between calls.
+    """
+    widths = {} if widths is None else widths
+
+    def measure(chunk):
+        if chunk not in widths:
+            widths[chunk] = font.measure(chunk)
+        return widths[chunk]
+
+    space = measure(" ")
+    lines = []
+    for paragraph in text.split("\n"):
+        line, line_width = [], 0
+        for word in paragraph.split(" "):
+            word_width = measure(word)
+            # A word longer than a whole line is split where it overflows
+            while word_width > width and len(word) > 1:
+                if line:
+                    lines.append(" ".join(line))
+                    line, line_width = [], 0
+                cut = len(word) - 1
+                while cut > 1 and measure(word[:cut]) > width:
+                    cut -= 1
+                lines.append(word[:cut])
+                word = word[cut:]
+                word_width = measure(word)
+            if line and line_width + space + word_width > width:
+                lines.append(" ".join(line))
+                line, line_width = [], 0
+            line_width += (space if line else 0) + word_width
+            line.append(word)
+        lines.append(" ".join(line))
+    return lines
+
+
+def option_style(colors, j, q, selected):
+    """Background, text colour and prefix of option j in a review card."""
+    if j == q.correct:
+        # Correct answer
+        return "#1e392a", colors["secondary"], "✓ "  # Dark green
+    if j == selected:
+        # User's incorrect answer
+        return "#3d1e1e", colors["accent"], "✗ "  # Dark red
+    # Other options
+    return colors["card_bg"], colors["text"], ""
+
+
+def review_status(colors, q, selected):
+    """Status text and colour of a review card."""
+    if selected is None:
+        return "Not Answered", colors["accent"]  # Treat unanswered as incorrect
+    if selected == q.correct:
+        return "✓ Correct", colors["secondary"]
+    return "✗ Incorrect", colors["accent"]
+
+
+class ReviewCard:
+    """One review card's widgets, filled in by show() for any question."""
+
+    def __init__(self, parent, app, slot):
+        self.app = app
+        self.slot = slot  # PhotoManager slot of this card's image
+        colors = app.colors
+
+        self.frame = tk.Frame(
+            parent,
+            bg=colors["card_bg"],
+            bd=0,
+            highlightbackground=colors["border"],
+            highlightthickness=1,
+            padx=15,
+            pady=15
+        )
+
+        # Question header with number and category
+        header_frame = tk.Frame(self.frame, bg=colors["card_bg"])
+        header_frame.pack(fill="x")
+
+        self.number_label = tk.Label(
+            header_frame,
+            font=app.fonts["body"],
+            bg=colors["card_bg"],
+            fg=colors["primary"]
+        )
+        self.number_label.pack(side="left")
+
+        self.category_label = tk.Label(
+            header_frame,
+            font=app.fonts["small"],
+            bg=colors["card_bg"],
+            fg=colors["light_text"]
+        )
+        self.category_label.pack(side="right")
+
+        # Status indicator
+        self.status_label = tk.Label(
+            self.frame,
+            font=app.fonts["small"],
+            bg=colors["card_bg"]
+        )
+        self.status_label.pack(anchor="w", pady=(5, 10))
+
+        # Question text
+        self.text_label = tk.Label(
+            self.frame,
+            font=app.fonts["body"],
+            wraplength=WRAP_WIDTH,
+            justify="left",
+            bg=colors["card_bg"],
+            fg=colors["text"]
+        )
+        self.text_label.pack(anchor="w", pady=(0, 10))
+
+        # Sign image, packed only for questions that have one
+        self.image_label = tk.Label(self.frame, bg=colors["card_bg"])
+
+        # Answer options, added as questions with more options come along
+        self.option_rows = []
+
+    def _option_row(self, j):
+        while len(self.option_rows) <= j:
+            option_frame = tk.Frame(self.frame, padx=10, pady=5)
+            option_label = tk.Label(
+                option_frame,
+                font=self.app.fonts["small"],
+                wraplength=WRAP_WIDTH,
+                justify="left",
+                padx=5,
+                pady=5
+            )
+            option_label.pack(anchor="w")
+            self.option_rows.append((option_frame, option_label))
+        return self.option_rows[j]
+
+    def show(self, index, q, selected):
+        """Fills the card with question q, number index, answered with selected (None if unanswered)."""
+        app = self.app
+        colors = app.colors
+        self.number_label.config(text=f"Question {index + 1}")
+        self.category_label.config(text=q.category_name)
+
+        status_text, status_color = review_status(colors, q, selected)
+        self.status_label.config(text=status_text, fg=status_color)
+
+        self.text_label.config(text=q.text)
+
+        # Show image if there was one
+        for option_frame, _ in self.option_rows:
+            option_frame.pack_forget()
+        self.image_label.pack_forget()
+        image_path = app.store.asset_path(q) if q.category == SIGNS else None
+        if image_path:
+            try:
+                photo = app.image_cache.photo(image_path, 150)  # Smaller for review
+                app.photos.show(self.slot, photo)
+                self.image_label.config(image=photo)
+                self.image_label.pack(anchor="w", pady=(0, 10))
+            except Exception:
+                app.photos.release(self.slot)
+        else:
+            self.image_label.config(image="")
+            app.photos.release(self.slot)
+
+        # Show all answer options, highlighting correct and user answers
+        for j, option_text in enumerate(q.options):
+            bg_color, fg_color, prefix = option_style(colors, j, q, selected)
+            option_frame, option_label = self._option_row(j)
+            option_frame.config(bg=bg_color)
+            option_label.config(text=f"{prefix}{option_text}", bg=bg_color, fg=fg_color)
+            option_frame.pack(fill="x", pady=2)
+
+
+class ScrolledReview:
+    """The canvas, scrollbar and mousewheel bindings both review lists share."""
+
+    def __init__(self, parent, app):
+        self.app = app
+        # (sequence, Tcl command) of each mousewheel binding: bind_all() registers a new
+        # Tcl command every time, which stays alive until unbind_mousewheel() deletes it
+        self._wheel_bindings = []
+
+        # Add scrollbar
+        self.scrollbar = ttk.Scrollbar(parent, style="Dark.Vertical.TScrollbar")
+        self.scrollbar.pack(side="right", fill="y")
+
+        # Create canvas
+        self.canvas = tk.Canvas(
+            parent,
+            bg=app.colors["card_bg"],
+            yscrollcommand=self._on_scroll,
+            highlightthickness=0
+        )
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.config(command=self.canvas.yview)
+
+        self.bind_mousewheel()
+        self.canvas.bind("<Configure>", self._on_resize)
+        self.canvas.bind("<Destroy>", self._on_destroy)
+
+    def bind_mousewheel(self):
+        """Scrolls the list with the mousewheel anywhere in the window."""
+        def _on_mousewheel(event):
+            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+        self.unbind_mousewheel()
+        self._wheel_bindings = [
+            ("<MouseWheel>", self.canvas.bind_all("<MouseWheel>", _on_mousewheel)),  # Windows and MacOS
+            ("<Button-4>", self.canvas.bind_all("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))),  # Linux
+            ("<Button-5>", self.canvas.bind_all("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))),  # Linux
+        ]
+
+    def unbind_mousewheel(self):
+        """Gives the mousewheel back, e.g. while the list is hidden."""
+        for sequence, command in self._wheel_bindings:
+            self.canvas.unbind_all(sequence)
+            self.canvas._root().deletecommand(command)
+        self._wheel_bindings = []
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+
+    def _on_resize(self, event):
+        pass
+
+    def _on_destroy(self, event):
+        # Unbind mousewheel on exit
+        if event.widget is self.canvas:
+            self.unbind_mousewheel()
+
+
+class ReviewList(ScrolledReview):
+    """
+    Scrollable list of review cards, virtualized.
+
+    Every entry has a height (measured once its card has been laid out,
+    estimated before that) and the scroll region is their sum, so the scrollbar
+    behaves as if all cards existed. Only the entries overlapping the visible
+    part of the canvas get a ReviewCard; cards scrolled out of view go back to
+    a pool and are refilled for the next entries that come into view.
+    """
+
+    def __init__(self, parent, app):
+        # entries[i] is (question number, question, selected option or None)
+        self.entries = []
+        self.heights = []
+        self.tops = []
+        # Entry index -> (card, canvas window item) for the cards on screen
+        self.bound = {}
+        # Cards not showing anything: (card, canvas window item)
+        self.free = []
+        self.card_count = 0
+        self._refresh_job = None
+        # True while refresh() runs, and when it was asked for again meanwhile
+        self._refreshing = False
+        self._refresh_again = False
+        super().__init__(parent, app)
+
+    def extend(self, entries):
+        """Appends entries [(question number, question, selected option or None), ...] to the list."""
+        for index, q, selected in entries:
+            self.entries.append((index, q, selected))
+            has_image = q.category == SIGNS and self.app.store.asset_path(q)
+            self.heights.append(ESTIMATED_CARD_HEIGHT + (ESTIMATED_IMAGE_HEIGHT if has_image else 0))
+        self._layout()
+        self.schedule_refresh()
+
+    def clear(self):
+        """Empties the list for the next results screen; the cards stay in the pool."""
+        if self._refresh_job is not None:
+            self.canvas.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        for card, window in self.bound.values():
+            self.canvas.itemconfigure(window, state="hidden")
+            self.app.photos.release(card.slot)
+            self.free.append((card, window))
+        self.bound = {}
+        self.entries = []
+        self.heights = []
+        self._layout()
+        self.canvas.yview_moveto(0)
+
+    def _layout(self):
+        """Recomputes every entry's top and the scroll region from the heights."""
+        self.tops = []
+        y = LIST_PADDING
+        for height in self.heights:
+            self.tops.append(y)
+            y += height + CARD_GAP
+        self.canvas.config(scrollregion=(0, 0, self.canvas.winfo_width(), y - CARD_GAP + LIST_PADDING))
+
+    def _card_width(self):
+        return max(self.canvas.winfo_width() - 2 * LIST_PADDING, 1)
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.schedule_refresh()
+
+    def _on_resize(self, event):
+        for _, window in list(self.bound.values()) + self.free:
+            self.canvas.itemconfigure(window, width=self._card_width())
+        self._layout()
+        self.schedule_refresh()
+
+    def _on_destroy(self, event):
+        if event.widget is self.canvas and self._refresh_job is not None:
+            self.canvas.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        super()._on_destroy(event)
+
+    def schedule_refresh(self):
+        """Refreshes the cards once Tk is idle, however many scroll events come in before that."""
+        if self._refresh_job is None:
+            self._refresh_job = self.canvas.after_idle(self.refresh)
+
+    def _visible(self):
+        """Indices of the entries overlapping the visible part of the canvas, plus OVERSCAN on each side."""
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        visible = [i for i, y in enumerate(self.tops) if y < bottom and y + self.heights[i] > top]
+        if not visible:
+            return range(0)
+        return range(max(visible[0] - OVERSCAN, 0), min(visible[-1] + OVERSCAN + 1, len(self.entries)))
+
+    def _take_card(self):
+        if self.free:
+            return self.free.pop()
+        card = ReviewCard(self.canvas, self.app, ("review", self.card_count))
+        self.card_count += 1
+        window = self.canvas.create_window(LIST_PADDING, 0, window=card.frame, anchor="nw",
+                                           width=self._card_width(), state="hidden")
+        return card, window
+
+    def refresh(self):
+        """Binds cards to the entries in view, releases the others and measures the new ones."""
+        self._refresh_job = None
+        if self._refreshing:
+            # Called back from the update_idletasks() below, with self.bound half updated;
+            # go again once this refresh is done
+            self._refresh_again = True
+            return
+        self._refreshing = True
+        try:
+            self._settle()
+        finally:
+            self._refreshing = False
+        if self._refresh_again:
+            self._refresh_again = False
+            self.schedule_refresh()
+
+    def _settle(self):
+        # Measuring a card can change the heights and with them what is in view; settle in a few passes
+        for _ in range(3):
+            wanted = self._visible()
+            for index in [index for index in self.bound if index not in wanted]:
+                card, window = self.bound.pop(index)
+                self.canvas.itemconfigure(window, state="hidden")
+                self.app.photos.release(card.slot)
+                self.free.append((card, window))
+
+            new = [index for index in wanted if index not in self.bound]
+            for index in new:
+                card, window = self._take_card()
+                card.show(*self.entries[index])
+                self.bound[index] = (card, window)
+
+            changed = False
+            if new:
+                self.canvas.update_idletasks()
+                for index in new:
+                    height = self.bound[index][0].frame.winfo_reqheight()
+                    if height != self.heights[index]:
+                        self.heights[index] = height
+                        changed = True
+                if changed:
+                    self._layout()
+
+            for index, (card, window) in self.bound.items():
+                self.canvas.coords(window, LIST_PADDING, self.tops[index])
+                self.canvas.itemconfigure(window, state="normal")
+            if not changed:
+                break
+
+
+class CanvasReviewList(ScrolledReview):
+    """
+    Review cards drawn straight onto the canvas, without a single widget.
+
+    Each card is a handful of rectangle, text and image items. Text is wrapped
+    with wrap_text() from the fonts' measurements, so card heights are known
+    without any layout pass and the scroll region is exact. Resizing the
+    window only redraws the items, which is cheap.
+    """
+
+    def __init__(self, parent, app):
+        # entries[i] is (question number, question, selected option or None)
+        self.entries = []
+        self.bottom = LIST_PADDING
+        self._drawn_width = None
+        self._widths = {}
+        super().__init__(parent, app)
+        self.fonts = {name: tkfont.Font(root=self.canvas, font=spec) for name, spec in app.fonts.items()}
+        self.line_heights = {name: font.metrics("linespace") for name, font in self.fonts.items()}
+
+    def extend(self, entries):
+        """Appends entries [(question number, question, selected option or None), ...] and draws them."""
+        for entry in entries:
+            self.entries.append(entry)
+            self.bottom += self._draw_card(self.bottom, *entry) + CARD_GAP
+        self.canvas.config(scrollregion=(0, 0, self.canvas.winfo_width(), self.bottom - CARD_GAP + LIST_PADDING))
+
+    def clear(self):
+        """Empties the list for the next results screen."""
+        self.canvas.delete("all")
+        for index, _, _ in self.entries:
+            self.app.photos.release(("review", index))
+        self.entries = []
+        self.bottom = LIST_PADDING
+        self.canvas.config(scrollregion=(0, 0, self.canvas.winfo_width(), 2 * LIST_PADDING))
+        self.canvas.yview_moveto(0)
+
+    def _on_resize(self, event):
+        if event.width != self._drawn_width:
+            self.canvas.delete("all")
+            self.bottom = LIST_PADDING
+            entries, self.entries = self.entries, []
+            self.extend(entries)
+
+    def _draw_text(self, x, y, text, font, color):
+        """Draws wrapped text with its top left corner at (x, y) and returns its height."""
+        lines = wrap_text(self.fonts[font], text, WRAP_WIDTH, self._widths)
+        self.canvas.create_text(x, y, text="\n".join(lines), font=self.fonts[font], fill=color,
+                                anchor="nw", justify="left")
+        return len(lines) * self.line_heights[font]
+
+    def _draw_card(self, top, index, q, selected):
+        """Draws one card with its top edge at top and returns its height."""
+        app = self.app
+        colors = app.colors
+        canvas = self.canvas
+        self._drawn_width = canvas.winfo_width()
+        left = LIST_PADDING
+        right = max(self._drawn_width - LIST_PADDING, left + WRAP_WIDTH + 2 * CARD_PADDING)
+        x = left + CARD_PADDING
+        y = top + CARD_PADDING
+
+        # Card background, stretched to the card's height once everything is drawn
+        card = canvas.create_rectangle(left, top, right, top, fill=colors["card_bg"], outline=colors["border"])
+
+        # Question header with number and category
+        canvas.create_text(x, y, text=f"Question {index + 1}", font=self.fonts["body"],
+                           fill=colors["primary"], anchor="nw")
+        canvas.create_text(right - CARD_PADDING, y, text=q.category_name, font=self.fonts["small"],
+                           fill=colors["light_text"], anchor="ne")
+        y += self.line_heights["body"] + 5
+
+        # Status indicator
+        status_text, status_color = review_status(colors, q, selected)
+        canvas.create_text(x, y, text=status_text, font=self.fonts["small"], fill=status_color, anchor="nw")
+        y += self.line_heights["small"] + 10
+
+        # Question text
+        y += self._draw_text(x, y, q.text, "body", colors["text"]) + 10
+
+        # Show image if there was one
+        image_path = app.store.asset_path(q) if q.category == SIGNS else None
+        if image_path:
+            try:
+                photo = app.photos.show(("review", index), app.image_cache.photo(image_path, 150))
+                canvas.create_image(x, y, image=photo, anchor="nw")
+                y += photo.height() + 10
+            except Exception:
+                pass
+
+        # Show all answer options, highlighting correct and user answers
+        for j, option_text in enumerate(q.options):
+            bg_color, fg_color, prefix = option_style(colors, j, q, selected)
+            y += 2
+            option = canvas.create_rectangle(x, y, right - CARD_PADDING, y, fill=bg_color, outline="")
+            height = self._draw_text(x + 15, y + 10, f"{prefix}{option_text}", "small", fg_color) + 20
+            canvas.coords(option, x, y, right - CARD_PADDING, y + height)
+            y += height + 2
+
+        y += CARD_PADDING
+        canvas.coords(card, left, top, right, y)
+        return y - top
+
+
+# Review list implementations by --review name
+REVIEW_VIEWS = {
+    "canvas": CanvasReviewList,
+    "widgets": ReviewList,
+}
@@ -1,170 +1,149 @@
 # sign_crops.py
-# IMPORTANT: Update the bounding box coordinates below to match your screenshots.
+# Generated by detect_signs.py from the screenshots in Images/.
 # Each entry is in the format:
 # "unique_sign_id": ("WhichPage.png", (left, top, right, bottom))
 
 sign_crops = {
-    "sign1":  ("1stSignPage.png", (0, 0, 100, 100)),
-    "sign3":  ("1stSignPage.png", (100, 0, 200, 100)),
-    "sign4":  ("1stSignPage.png", (200, 0, 300, 100)),
-    "sign5":  ("1stSignPage.png", (300, 0, 400, 100)),
-    "sign6":  ("1stSignPage.png", (400, 0, 500, 100)),
-    "sign10": ("1stSignPage.png", (0, 100, 100, 200)),
-    "sign11": ("1stSignPage.png", (100, 100, 200, 200)),
-    "sign13": ("1stSignPage.png", (200, 100, 300, 200)),
-    "sign14": ("1stSignPage.png", (300, 100, 400, 200)),
-    "sign15": ("1stSignPage.png", (400, 100, 500, 200)),
-    "sign17": ("1stSignPage.png", (0, 200, 100, 300)),
-    "sign18": ("1stSignPage.png", (100, 200, 200, 300)),
-    "sign19": ("1stSignPage.png", (200, 200, 300, 300)),
-    "sign24": ("1stSignPage.png", (300, 200, 400, 300)),
-    "sign25": ("1stSignPage.png", (400, 200, 500, 300)),
-    "sign26": ("1stSignPage.png", (0, 300, 100, 400)),
-    "sign29": ("1stSignPage.png", (100, 300, 200, 400)),
-    "sign30": ("1stSignPage.png", (200, 300, 300, 400)),
-    "sign31": ("1stSignPage.png", (300, 300, 400, 400)),
-    "sign32": ("1stSignPage.png", (400, 300, 500, 400)),
-    "sign33": ("1stSignPage.png", (0, 400, 100, 500)),
-
-    # Signs on the 2ndSignPage.png
-    "sign37": ("2ndSignPage.png", (0, 0, 150, 150)),
-    "sign38": ("2ndSignPage.png", (150, 0, 300, 150)),
-    "sign39": ("2ndSignPage.png", (300, 0, 450, 150)),
-    "sign40": ("2ndSignPage.png", (450, 0, 600, 150)),
-    "sign41": ("2ndSignPage.png", (0, 150, 150, 300)),
-    "sign42": ("2ndSignPage.png", (150, 150, 300, 300)),
-    "sign43": ("2ndSignPage.png", (300, 150, 450, 300)),
-    "sign44": ("2ndSignPage.png", (450, 150, 600, 300)),
-    "sign45": ("2ndSignPage.png", (0, 300, 150, 450)),
-    "sign46": ("2ndSignPage.png", (150, 300, 300, 450)),
-    "sign47": ("2ndSignPage.png", (300, 300, 450, 450)),
-    "sign48": ("2ndSignPage.png", (450, 300, 600, 450)),
-    "sign49": ("2ndSignPage.png", (0, 450, 150, 600)),
-    "sign50": ("2ndSignPage.png", (150, 450, 300, 600)),
-    "sign51": ("2ndSignPage.png", (300, 450, 450, 600)),
-    "sign52": ("2ndSignPage.png", (450, 450, 600, 600)),
-    "sign53": ("2ndSignPage.png", (0, 600, 150, 750)),
-    "sign55": ("2ndSignPage.png", (150, 600, 300, 750)),
-    "sign56": ("2ndSignPage.png", (300, 600, 450, 750)),
-    "sign57": ("2ndSignPage.png", (450, 600, 600, 750)),
-    "sign58": ("2ndSignPage.png", (0, 750, 150, 900)),
-
-    # Signs on the 3rdSignPage.png
-    "sign60": ("3rdSignPage.png", (0, 0, 150, 150)),
-    "sign61": ("3rdSignPage.png", (150, 0, 300, 150)),
-    "sign62": ("3rdSignPage.png", (300, 0, 450, 150)),
-    "sign63": ("3rdSignPage.png", (450, 0, 600, 150)),
-    "sign64": ("3rdSignPage.png", (0, 150, 150, 300)),
-    "sign65": ("3rdSignPage.png", (150, 150, 300, 300)),
-    "sign66": ("3rdSignPage.png", (300, 150, 450, 300)),
-    "sign67": ("3rdSignPage.png", (450, 150, 600, 300)),
-    "sign68": ("3rdSignPage.png", (0, 300, 150, 450)),
-    "sign69": ("3rdSignPage.png", (150, 300, 300, 450)),
-    "sign71": ("3rdSignPage.png", (300, 300, 450, 450)),
-    "sign72": ("3rdSignPage.png", (450, 300, 600, 450)),
-    "sign75": ("3rdSignPage.png", (0, 450, 150, 600)),
-    "sign76": ("3rdSignPage.png", (150, 450, 300, 600)),
-    "sign77": ("3rdSignPage.png", (300, 450, 450, 600)),
-    "sign78": ("3rdSignPage.png", (450, 450, 600, 600)),
-    "sign79": ("3rdSignPage.png", (0, 600, 150, 750)),
-    "sign80": ("3rdSignPage.png", (150, 600, 300, 750)),
-    "sign81": ("3rdSignPage.png", (300, 600, 450, 750)),
-    "sign84": ("3rdSignPage.png", (450, 600, 600, 750)),
-    "sign85": ("3rdSignPage.png", (0, 750, 150, 900)),
-    "sign86": ("3rdSignPage.png", (150, 750, 300, 900)),
-    "sign87": ("3rdSignPage.png", (300, 750, 450, 900)),
-    "sign88": ("3rdSignPage.png", (450, 750, 600, 900)),
-
-    # Signs on the 4thSignPage.png
-    "sign89":  ("4thSignPage.png", (0, 0, 150, 150)),
-    "sign90":  ("4thSignPage.png", (150, 0, 300, 150)),
-    "sign91":  ("4thSignPage.png", (300, 0, 450, 150)),
-    "sign92":  ("4thSignPage.png", (450, 0, 600, 150)),
-    "sign93":  ("4thSignPage.png", (0, 150, 150, 300)),
-    "sign94":  ("4thSignPage.png", (150, 150, 300, 300)),
-    "sign95":  ("4thSignPage.png", (300, 150, 450, 300)),
-    "sign96":  ("4thSignPage.png", (450, 150, 600, 300)),
-    "sign97":  ("4thSignPage.png", (0, 300, 150, 450)),
-    "sign98":  ("4thSignPage.png", (150, 300, 300, 450)),
-    "sign99":  ("4thSignPage.png", (300, 300, 450, 450)),
-    "sign100": ("4thSignPage.png", (450, 300, 600, 450)),
-    "sign101": ("4thSignPage.png", (0, 450, 150, 600)),
-    "sign102": ("4thSignPage.png", (150, 450, 300, 600)),
-    "sign103": ("4thSignPage.png", (300, 450, 450, 600)),
-    "sign104": ("4thSignPage.png", (450, 450, 600, 600)),
-    "sign105": ("4thSignPage.png", (0, 600, 150, 750)),
-    "sign106": ("4thSignPage.png", (150, 600, 300, 750)),
-    "sign107": ("4thSignPage.png", (300, 600, 450, 750)),
-    "sign108": ("4thSignPage.png", (450, 600, 600, 750)),
-    "sign109": ("4thSignPage.png", (0, 750, 150, 900)),
-    "sign111": ("4thSignPage.png", (150, 750, 300, 900)),
-    "sign112": ("4thSignPage.png", (300, 750, 450, 900)),
-    "sign113": ("4thSignPage.png", (450, 750, 600, 900)),
-    "sign116": ("4thSignPage.png", (0, 900, 150, 1050)),
-    "sign117": ("4thSignPage.png", (150, 900, 300, 1050)),
-    "sign118": ("4thSignPage.png", (300, 900, 450, 1050)),
-    "sign119": ("4thSignPage.png", (450, 900, 600, 1050)),
-    "sign121": ("4thSignPage.png", (0, 1050, 150, 1200)),
-    "sign128": ("4thSignPage.png", (150, 1050, 300, 1200)),
-    "sign129": ("4thSignPage.png", (300, 1050, 450, 1200)),
-    "sign132": ("4thSignPage.png", (450, 1050, 600, 1200)),
-    "sign133": ("4thSignPage.png", (0, 1200, 150, 1350)),
-    "sign139": ("4thSignPage.png", (150, 1200, 300, 1350)),
-    "sign141": ("4thSignPage.png", (300, 1200, 450, 1350)),
-    "sign142": ("4thSignPage.png", (450, 1200, 600, 1350)),
-    "sign143": ("4thSignPage.png", (0, 1350, 150, 1500)),
-    "sign144": ("4thSignPage.png", (150, 1350, 300, 1500)),
-    "sign145": ("4thSignPage.png", (300, 1350, 450, 1500)),
-    "sign146": ("4thSignPage.png", (450, 1350, 600, 1500)),
-    "sign147": ("4thSignPage.png", (0, 1500, 150, 1650)),
-    "sign148": ("4thSignPage.png", (150, 1500, 300, 1650)),
-    "sign149": ("4thSignPage.png", (300, 1500, 450, 1650)),
-    "sign150": ("4thSignPage.png", (450, 1500, 600, 1650)),
-    "sign151": ("4thSignPage.png", (0, 1650, 150, 1800)),
-    "sign152": ("4thSignPage.png", (150, 1650, 300, 1800)),
-    "sign153": ("4thSignPage.png", (300, 1650, 450, 1800)),
-    "sign154": ("4thSignPage.png", (450, 1650, 600, 1800)),
-    "sign155": ("4thSignPage.png", (0, 1800, 150, 1950)),
-    "sign156": ("4thSignPage.png", (150, 1800, 300, 1950)),
-    "sign157": ("4thSignPage.png", (300, 1800, 450, 1950)),
-    "sign158": ("4thSignPage.png", (450, 1800, 600, 1950)),
-    "sign159": ("4thSignPage.png", (0, 1950, 150, 2100)),
-    "sign160": ("4thSignPage.png", (150, 1950, 300, 2100)),
-    "sign161": ("4thSignPage.png", (300, 1950, 450, 2100)),
-    "sign162": ("4thSignPage.png", (450, 1950, 600, 2100)),
-    "sign163": ("4thSignPage.png", (0, 2100, 150, 2250)),
-    "sign164": ("4thSignPage.png", (150, 2100, 300, 2250)),
-    "sign165": ("4thSignPage.png", (300, 2100, 450, 2250)),
-    "sign166": ("4thSignPage.png", (450, 2100, 600, 2250)),
-    "sign167": ("4thSignPage.png", (0, 2250, 150, 2400)),
-    "sign168": ("4thSignPage.png", (150, 2250, 300, 2400)),
-    "sign169": ("4thSignPage.png", (300, 2250, 450, 2400)),
-    "sign170": ("4thSignPage.png", (450, 2250, 600, 2400)),
-    "sign171": ("4thSignPage.png", (0, 2400, 150, 2550)),
-    "sign172": ("4thSignPage.png", (150, 2400, 300, 2550)),
-    "sign173": ("4thSignPage.png", (300, 2400, 450, 2550)),
-    "sign174": ("4thSignPage.png", (450, 2400, 600, 2550)),
-    "sign175": ("4thSignPage.png", (0, 2550, 150, 2700)),
-    "sign176": ("4thSignPage.png", (150, 2550, 300, 2700)),
-    "sign177": ("4thSignPage.png", (300, 2550, 450, 2700)),
-    "sign178": ("4thSignPage.png", (450, 2550, 600, 2700)),
-    "sign179": ("4thSignPage.png", (0, 2700, 150, 2850)),
-    "sign180": ("4thSignPage.png", (150, 2700, 300, 2850)),
-    "sign181": ("4thSignPage.png", (300, 2700, 450, 2850)),
-    "sign182": ("4thSignPage.png", (450, 2700, 600, 2850)),
-    "sign183": ("4thSignPage.png", (0, 2850, 150, 3000)),
-    "sign184": ("4thSignPage.png", (150, 2850, 300, 3000)),
-    "sign185": ("4thSignPage.png", (300, 2850, 450, 3000)),
-    "sign186": ("4thSignPage.png", (450, 2850, 600, 3000)),
-    "sign187": ("4thSignPage.png", (0, 3000, 150, 3150)),
-    "sign188": ("4thSignPage.png", (150, 3000, 300, 3150)),
-    "sign189": ("4thSignPage.png", (300, 3000, 450, 3150)),
-    "sign190": ("4thSignPage.png", (450, 3000, 600, 3150)),
-    "sign191": ("4thSignPage.png", (0, 3150, 150, 3300)),
-    "sign192": ("4thSignPage.png", (150, 3150, 300, 3300)),
-    "sign193": ("4thSignPage.png", (300, 3150, 450, 3300)),
-    "sign194": ("4thSignPage.png", (450, 3150, 600, 3300)),
-    "sign195": ("4thSignPage.png", (0, 3300, 150, 3450)),
-    "sign196": ("4thSignPage.png", (150, 3300, 300, 3450)),
-    "sign197": ("4thSignPage.png", (300, 3300, 450, 3450)),
+    "sign1":   ("1stSignPage.png", (13, 14, 131, 117)),
+    "sign2":   ("1stSignPage.png", (192, 17, 307, 115)),
+    "sign3":   ("1stSignPage.png", (364, 15, 483, 118)),
+    "sign4":   ("1stSignPage.png", (532, 4, 662, 117)),
+    "sign5":   ("1stSignPage.png", (710, 6, 835, 114)),
+    "sign6":   ("1stSignPage.png", (884, 6, 1010, 116)),
+    "sign7":   ("1stSignPage.png", (1059, 4, 1184, 113)),
+    "sign8":   ("1stSignPage.png", (1235, 5, 1358, 113)),
+    "sign9":   ("1stSignPage.png", (14, 186, 135, 292)),
+    "sign10":  ("1stSignPage.png", (188, 188, 306, 292)),
+    "sign11":  ("1stSignPage.png", (360, 189, 480, 293)),
+    "sign12":  ("1stSignPage.png", (532, 176, 661, 289)),
+    "sign13":  ("1stSignPage.png", (709, 177, 835, 287)),
+    "sign14":  ("1stSignPage.png", (882, 177, 1011, 288)),
+    "sign15":  ("1stSignPage.png", (1057, 177, 1185, 290)),
+    "sign16":  ("1stSignPage.png", (1236, 178, 1356, 285)),
+    "sign17":  ("1stSignPage.png", (13, 364, 131, 467)),
+    "sign18":  ("1stSignPage.png", (190, 358, 306, 472)),
+    "sign19":  ("1stSignPage.png", (364, 362, 480, 463)),
+    "sign20":  ("1stSignPage.png", (534, 351, 659, 460)),
+    "sign21":  ("1stSignPage.png", (709, 350, 835, 460)),
+    "sign22":  ("1stSignPage.png", (881, 353, 1012, 466)),
+    "sign23":  ("1stSignPage.png", (1061, 352, 1186, 461)),
+    "sign24":  ("1stSignPage.png", (1239, 354, 1351, 465)),
+    "sign25":  ("1stSignPage.png", (13, 525, 132, 629)),
+    "sign26":  ("1stSignPage.png", (185, 526, 312, 637)),
+    "sign27":  ("1stSignPage.png", (364, 528, 484, 633)),
+    "sign28":  ("1stSignPage.png", (533, 525, 660, 637)),
+    "sign29":  ("1stSignPage.png", (709, 530, 832, 637)),
+    "sign30":  ("1stSignPage.png", (884, 530, 1010, 641)),
+    "sign31":  ("1stSignPage.png", (1065, 536, 1180, 638)),
+    "sign32":  ("1stSignPage.png", (1235, 527, 1357, 634)),
+    "sign33":  ("1stSignPage.png", (12, 702, 133, 809)),
+    "sign34":  ("1stSignPage.png", (187, 700, 310, 808)),
+    "sign35":  ("1stSignPage.png", (363, 711, 483, 816)),
+    "sign36":  ("1stSignPage.png", (537, 711, 660, 818)),
+    "sign37":  ("1stSignPage.png", (713, 712, 834, 818)),
+    "sign38":  ("1stSignPage.png", (886, 715, 1007, 821)),
+    "sign39":  ("1stSignPage.png", (1062, 702, 1179, 818)),
+    "sign40":  ("1stSignPage.png", (1238, 699, 1356, 816)),
+    "sign41":  ("2ndSignPage.png", (14, 13, 128, 125)),
+    "sign42":  ("2ndSignPage.png", (189, 20, 304, 134)),
+    "sign43":  ("2ndSignPage.png", (364, 17, 480, 132)),
+    "sign44":  ("2ndSignPage.png", (532, 9, 657, 133)),
+    "sign45":  ("2ndSignPage.png", (712, 20, 828, 135)),
+    "sign46":  ("2ndSignPage.png", (884, 20, 1002, 136)),
+    "sign47":  ("2ndSignPage.png", (1060, 13, 1179, 130)),
+    "sign48":  ("2ndSignPage.png", (1234, 16, 1354, 134)),
+    "sign49":  ("2ndSignPage.png", (12, 185, 131, 303)),
+    "sign50":  ("2ndSignPage.png", (186, 185, 305, 302)),
+    "sign51":  ("2ndSignPage.png", (361, 185, 480, 302)),
+    "sign52":  ("2ndSignPage.png", (534, 186, 653, 304)),
+    "sign53":  ("2ndSignPage.png", (708, 185, 829, 305)),
+    "sign54":  ("2ndSignPage.png", (888, 186, 999, 296)),
+    "sign55":  ("2ndSignPage.png", (1062, 187, 1180, 303)),
+    "sign56":  ("2ndSignPage.png", (1236, 186, 1351, 300)),
+    "sign57":  ("2ndSignPage.png", (14, 361, 129, 473)),
+    "sign58":  ("2ndSignPage.png", (190, 362, 301, 472)),
+    "sign59":  ("2ndSignPage.png", (361, 360, 480, 476)),
+    "sign60":  ("2ndSignPage.png", (537, 361, 652, 475)),
+    "sign61":  ("2ndSignPage.png", (711, 359, 829, 474)),
+    "sign62":  ("2ndSignPage.png", (889, 362, 1001, 473)),
+    "sign63":  ("2ndSignPage.png", (1063, 363, 1176, 476)),
+    "sign64":  ("2ndSignPage.png", (1237, 364, 1348, 473)),
+    "sign65":  ("2ndSignPage.png", (16, 536, 130, 649)),
+    "sign66":  ("2ndSignPage.png", (187, 536, 304, 651)),
+    "sign67":  ("2ndSignPage.png", (360, 532, 480, 651)),
+    "sign68":  ("2ndSignPage.png", (536, 536, 652, 649)),
+    "sign69":  ("2ndSignPage.png", (711, 535, 830, 653)),
+    "sign70":  ("2ndSignPage.png", (886, 608, 1004, 648)),
+    "sign71":  ("2ndSignPage.png", (1064, 539, 1171, 645)),
+    "sign72":  ("2ndSignPage.png", (1240, 537, 1352, 648)),
+    "sign73":  ("2ndSignPage.png", (11, 705, 131, 824)),
+    "sign74":  ("2ndSignPage.png", (187, 708, 307, 827)),
+    "sign75":  ("2ndSignPage.png", (359, 708, 478, 825)),
+    "sign76":  ("2ndSignPage.png", (534, 707, 655, 828)),
+    "sign77":  ("2ndSignPage.png", (707, 706, 829, 826)),
+    "sign78":  ("2ndSignPage.png", (883, 704, 1005, 825)),
+    "sign79":  ("2ndSignPage.png", (1059, 706, 1181, 826)),
+    "sign80":  ("2ndSignPage.png", (1232, 706, 1354, 827)),
+    "sign81":  ("3rdSignPage.png", (19, 10, 138, 128)),
+    "sign82":  ("3rdSignPage.png", (192, 8, 312, 127)),
+    "sign83":  ("3rdSignPage.png", (367, 10, 485, 126)),
+    "sign84":  ("3rdSignPage.png", (542, 10, 658, 125)),
+    "sign85":  ("3rdSignPage.png", (716, 8, 834, 125)),
+    "sign86":  ("3rdSignPage.png", (893, 14, 1005, 125)),
+    "sign87":  ("3rdSignPage.png", (1064, 10, 1176, 121)),
+    "sign88":  ("3rdSignPage.png", (1240, 11, 1351, 121)),
+    "sign89":  ("3rdSignPage.png", (23, 183, 134, 290)),
+    "sign90":  ("3rdSignPage.png", (196, 180, 306, 289)),
+    "sign91":  ("3rdSignPage.png", (388, 230, 464, 308)),
+    "sign92":  ("3rdSignPage.png", (545, 183, 660, 297)),
+    "sign93":  ("3rdSignPage.png", (719, 184, 831, 294)),
+    "sign94":  ("3rdSignPage.png", (891, 180, 1006, 294)),
+    "sign95":  ("3rdSignPage.png", (1064, 182, 1176, 293)),
+    "sign96":  ("3rdSignPage.png", (1239, 183, 1351, 294)),
+    "sign97":  ("3rdSignPage.png", (22, 357, 132, 466)),
+    "sign98":  ("3rdSignPage.png", (192, 354, 311, 470)),
+    "sign99":  ("3rdSignPage.png", (365, 351, 488, 472)),
+    "sign100": ("3rdSignPage.png", (538, 350, 662, 474)),
+    "sign101": ("3rdSignPage.png", (721, 354, 832, 464)),
+    "sign102": ("3rdSignPage.png", (889, 353, 1004, 466)),
+    "sign103": ("3rdSignPage.png", (1065, 353, 1180, 467)),
+    "sign104": ("3rdSignPage.png", (1238, 354, 1353, 468)),
+    "sign105": ("3rdSignPage.png", (24, 531, 131, 637)),
+    "sign106": ("3rdSignPage.png", (201, 535, 304, 636)),
+    "sign107": ("3rdSignPage.png", (369, 529, 481, 639)),
+    "sign108": ("3rdSignPage.png", (546, 532, 657, 640)),
+    "sign109": ("3rdSignPage.png", (715, 529, 834, 647)),
+    "sign110": ("3rdSignPage.png", (890, 526, 1008, 643)),
+    "sign111": ("3rdSignPage.png", (1063, 524, 1182, 642)),
+    "sign112": ("3rdSignPage.png", (1236, 526, 1357, 646)),
+    "sign113": ("3rdSignPage.png", (37, 695, 119, 816)),
+    "sign114": ("3rdSignPage.png", (211, 696, 292, 818)),
+    "sign115": ("3rdSignPage.png", (385, 696, 466, 818)),
+    "sign116": ("3rdSignPage.png", (559, 695, 642, 819)),
+    "sign117": ("3rdSignPage.png", (734, 699, 812, 815)),
+    "sign118": ("3rdSignPage.png", (908, 696, 988, 815)),
+    "sign119": ("3rdSignPage.png", (1081, 697, 1161, 816)),
+    "sign120": ("3rdSignPage.png", (1256, 697, 1336, 816)),
+    "sign121": ("4thSignPage.png", (20, 238, 169, 385)),
+    "sign122": ("4thSignPage.png", (242, 241, 389, 386)),
+    "sign123": ("4thSignPage.png", (457, 239, 606, 386)),
+    "sign124": ("4thSignPage.png", (679, 244, 818, 383)),
+    "sign125": ("4thSignPage.png", (899, 241, 1036, 377)),
+    "sign126": ("4thSignPage.png", (1117, 243, 1257, 381)),
+    "sign127": ("4thSignPage.png", (1335, 243, 1475, 381)),
+    "sign128": ("4thSignPage.png", (1569, 234, 1675, 388)),
+    "sign129": ("4thSignPage.png", (46, 453, 148, 603)),
+    "sign130": ("4thSignPage.png", (263, 455, 364, 604)),
+    "sign131": ("4thSignPage.png", (479, 453, 582, 606)),
+    "sign132": ("4thSignPage.png", (697, 452, 803, 606)),
+    "sign133": ("4thSignPage.png", (916, 456, 1017, 602)),
+    "sign134": ("4thSignPage.png", (1133, 453, 1236, 605)),
+    "sign135": ("4thSignPage.png", (1351, 450, 1456, 605)),
+    "sign136": ("4thSignPage.png", (1569, 450, 1674, 605)),
+    "sign137": ("4thSignPage.png", (43, 667, 149, 824)),
+    "sign138": ("4thSignPage.png", (261, 667, 367, 821)),
+    "sign139": ("4thSignPage.png", (455, 696, 609, 825)),
+    "sign140": ("4thSignPage.png", (675, 697, 826, 821)),
+    "sign141": ("4thSignPage.png", (895, 723, 1045, 821)),
+    "sign142": ("4thSignPage.png", (1111, 744, 1261, 817)),
 }
@@ -0,0 +1,198 @@
+# sign_hashes.py
+# Perceptual hashes of the sign crops, to catch mistakes in sign_crops.py that
+# are easy to miss by eye: the same sign cut twice, a box that slipped onto
+# empty paper, or a question image that no longer matches its sign.
+#
+# Each crop gets a perceptual hash (pHash): the crop is shrunk to 64x64 grey
+# pixels, turned into frequencies by a DCT, and every bit says whether one of
+# the 16x16 lowest frequencies is above their median. Similar images have
+# hashes a few bits apart. Lookups go through a multi-index hash instead of
+# comparing every pair: the hash is cut into more pieces than the search
+# radius, so a hash within the radius matches at least one piece exactly,
+# and only the hashes sharing a piece are compared. (A plain 8x8 difference
+# hash is not enough here: it puts every red warning triangle within a few
+# bits of the others.)
+#
+#     python sign_hashes.py duplicates       near-duplicate and blank crops
+#     python sign_hashes.py lookup <image>   which sign, and which questions, an image is
+#
+# Needs NumPy.
+
+import sys
+
+import numpy
+from PIL import Image
+
+from sign_crops import sign_crops
+from sign_images import SheetStore, sign_id_for
+
+# Side of the grey image the DCT runs over, and of the block of low frequencies kept
+HASH_IMAGE_SIZE = 64
+HASH_SIZE = 16
+
+# Hashes at most this many bits (of 255) apart count as the same sign. The two
+# screenshots of signs 113-120 come out 8-24 bits apart, different signs 40 or more.
+DUPLICATE_DISTANCE = 30
+
+# Crops whose grey levels vary less than this (standard deviation) are blank
+BLANK_DEVIATION = 8.0
+
+
+def _dct_matrix(n):
+    """The orthonormal DCT-II matrix of size n."""
+    k = numpy.arange(n)
+    matrix = numpy.cos(numpy.pi * (2 * k[None, :] + 1) * k[:, None] / (2 * n)) * numpy.sqrt(2 / n)
+    matrix[0] /= numpy.sqrt(2)
+    return matrix
+
+
+_DCT = _dct_matrix(HASH_IMAGE_SIZE)
+
+
+def phash(img):
+    """Returns the perceptual hash of a PIL image as an int of HASH_SIZE ** 2 - 1 bits."""
+    size = (HASH_IMAGE_SIZE, HASH_IMAGE_SIZE)
+    grey = numpy.asarray(img.convert("L").resize(size, Image.BOX), dtype=numpy.float64)
+    frequencies = (_DCT @ grey @ _DCT.T)[:HASH_SIZE, :HASH_SIZE].ravel()[1:]  # Without the average (DC) term
+    bits = frequencies > numpy.median(frequencies)
+    return int.from_bytes(numpy.packbits(bits).tobytes(), "big")
+
+
+def is_blank(img):
+    """True when an image is (nearly) one flat colour, e.g. a box over empty paper."""
+    return float(numpy.asarray(img.convert("L"), dtype=numpy.float32).std()) < BLANK_DEVIATION
+
+
+def distance(a, b):
+    """Hamming distance between two hashes."""
+    return bin(a ^ b).count("1")
+
+
+class MultiIndexHash:
+    """
+    Hashes of a fixed number of bits, searchable within a fixed Hamming radius.
+
+    Each hash is cut into radius + 1 substrings, each with a table of the keys
+    by their exact value. Two hashes at most radius bits apart differ in at
+    most radius substrings, so they share at least one (the pigeonhole
+    principle): a search only compares the hashes found in the query's own
+    substring buckets.
+    """
+
+    def __init__(self, bits, radius):
+        self.radius = radius
+        # (shift, mask) of every substring, the first bits % parts of them one bit wider
+        parts = radius + 1
+        width, wider = divmod(bits, parts)
+        self.substrings = []
+        shift = bits
+        for i in range(parts):
+            shift -= width + (i < wider)
+            self.substrings.append((shift, (1 << (width + (i < wider))) - 1))
+        self.tables = [{} for _ in self.substrings]
+        self.keys = {}  # hash -> [keys]
+        self.compared = 0  # Hashes compared by the searches so far
+
+    def __len__(self):
+        return sum(len(keys) for keys in self.keys.values())
+
+    def add(self, value, key):
+        """Adds key under hash value. Keys with the same hash share one entry."""
+        if value not in self.keys:
+            self.keys[value] = []
+            for (shift, mask), table in zip(self.substrings, self.tables):
+                table.setdefault((value >> shift) & mask, []).append(value)
+        self.keys[value].append(key)
+
+    def search(self, value, radius=None):
+        """Returns [(distance, key), ...] for every key within radius of value, nearest first."""
+        radius = self.radius if radius is None else radius
+        if radius > self.radius:
+            raise ValueError(f"radius {radius} is above the index's {self.radius}")
+        candidates = set()
+        for (shift, mask), table in zip(self.substrings, self.tables):
+            candidates.update(table.get((value >> shift) & mask, ()))
+        self.compared += len(candidates)
+        found = []
+        for candidate in candidates:
+            d = distance(value, candidate)
+            if d <= radius:
+                found.extend((d, key) for key in self.keys[candidate])
+        found.sort()
+        return found
+
+    def nearest(self, value, radius=None):
+        """Returns (distance, key) of the closest key within radius, or None."""
+        found = self.search(value, radius)
+        return found[0] if found else None
+
+
+class SignHashIndex:
+    """The pHash of every crop in a sign_crops table, in a MultiIndexHash, plus the crops that are blank."""
+
+    def __init__(self, crops=None, sheets=None):
+        crops = sign_crops if crops is None else crops
+        sheets = sheets or SheetStore()
+        self.hashes = {}
+        self.blank = []
+        self.hash_index = MultiIndexHash(HASH_SIZE ** 2 - 1, DUPLICATE_DISTANCE)
+        for sign_id, (page, box) in crops.items():
+            width, height = sheets.size(page)
+            left, top, right, bottom = box
+            if not (0 <= left < right <= width and 0 <= top < bottom <= height):
+                continue  # build_cache reports those
+            img = sheets.crop_image(page, box)
+            if is_blank(img):
+                self.blank.append(sign_id)
+                continue  # Every blank crop hashes alike; they would all look like duplicates
+            self.hashes[sign_id] = phash(img)
+            self.hash_index.add(self.hashes[sign_id], sign_id)
+
+    def duplicates(self, radius=DUPLICATE_DISTANCE):
+        """Returns [(distance, sign ID, sign ID), ...] for every pair of crops within radius."""
+        pairs = []
+        for sign_id, value in self.hashes.items():
+            for d, other in self.hash_index.search(value, radius):
+                if sign_id < other:
+                    pairs.append((d, sign_id, other))
+        pairs.sort()
+        return pairs
+
+    def lookup(self, img, radius=DUPLICATE_DISTANCE):
+        """Returns (distance, sign ID) of the crop that looks most like img, or None."""
+        return self.hash_index.nearest(phash(img), radius)
+
+
+def questions_for(sign_id, bank=None):
+    """Returns the questions whose image is sign_id."""
+    if bank is None:
+        from question_bank import get_bank
+        bank = get_bank()
+    return [q for q in bank.all_questions() if sign_id_for(q.image) == sign_id]
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) in (2, 3) else None
+    if command == "duplicates" and len(sys.argv) == 2:
+        index = SignHashIndex()
+        duplicates = index.duplicates()
+        for d, a, b in duplicates:
+            print(f"{a} and {b} look alike ({d} bits apart)")
+        for sign_id in index.blank:
+            print(f"{sign_id}: {sign_crops[sign_id]} is blank")
+        pairs = len(index.hashes) * (len(index.hashes) - 1) // 2
+        print(f"{len(index.hashes)} crops hashed, {len(duplicates)} near-duplicate pairs, "
+              f"{len(index.blank)} blank ({index.hash_index.compared} hashes compared for {pairs} pairs)")
+    elif command == "lookup" and len(sys.argv) == 3:
+        with Image.open(sys.argv[2]) as query:
+            match = SignHashIndex().lookup(query)
+        if match is None:
+            print(f"No sign looks like {sys.argv[2]}")
+            sys.exit(1)
+        d, sign_id = match
+        print(f"{sign_id} ({d} bits apart), {sign_crops[sign_id]}")
+        for q in questions_for(sign_id):
+            print(f"  question {q.id}: {q.text}")
+    else:
+        print("usage: python sign_hashes.py duplicates | lookup <image>")
+        sys.exit(2)
@@ -0,0 +1,741 @@
+# sign_images.py
+# Cuts the sign images out of the screenshots in Images/ using the boxes in
+# sign_crops.py and keeps them in a content-hashed cache, so the quiz only ever
+# loads small pre-cropped files instead of whole sign sheets. Every crop is also
+# stored ready-sized at each THUMBNAIL_SIZES, so the views never resize at runtime.
+# The thumbnails are packed into one atlas file (see ThumbnailAtlas), read
+# through a single mapping instead of one open() per image.
+#
+# The quiz refreshes the cache on start-up; to do it by hand run:
+#     python sign_images.py build
+# After replacing the sheet screenshots, regenerate everything on all cores with:
+#     python sign_images.py build --force --jobs 0
+#
+# SheetStore keeps each sheet decoded to raw RGBA in the cache folder and maps
+# it into memory, so a sheet is decoded once for all runs and processes.
+#
+# ImageCache keeps the decoded and resized images in memory between displays,
+# ImagePrefetcher fills it from worker threads ahead of time, and PhotoManager
+# decides which PhotoImages the screen still needs.
+
+import argparse
+import hashlib
+import io
+import json
+import mmap
+import os
+import queue
+import re
+import struct
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from PIL import Image, ImageTk
+
+from sign_crops import sign_crops
+
+try:
+    import numpy
+except ImportError:  # Optional: without it crops are cut by PIL from the same mapping
+    numpy = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SHEET_DIR = os.path.join(BASE_DIR, "Images")
+CACHE_DIR = os.path.join(BASE_DIR, "sign_cache")
+INDEX_NAME = "index.json"
+ATLAS_NAME = "thumbnails.atlas"
+
+# Bump whenever the cached files, the index or the atlas change layout
+CACHE_FORMAT_VERSION = 3
+
+# Pre-rendered sizes: question view, review cards, small previews
+THUMBNAIL_SIZES = (300, 150, 64)
+
+# How far above the target size resize_image() switches from cheap reduction to LANCZOS
+RESIZE_GAP = 3
+
+# zlib level of the cached crops and thumbnails. Level 1 encodes 2.5x faster than PIL's
+# default 6 for 14% larger files; the encoding was most of a cold build_cache()
+PNG_COMPRESS_LEVEL = 1
+
+# Header of a raw sheet file: magic, width, height; RGBA rows follow
+RAW_HEADER = struct.Struct("<4sII")
+RAW_MAGIC = b"RGBA"
+
+# Header of the thumbnail atlas: magic, CACHE_FORMAT_VERSION, length of the
+# JSON index that follows; the PNG data comes after the index
+ATLAS_HEADER = struct.Struct("<4sII")
+ATLAS_MAGIC = b"SATL"
+
+# Default memory budget of an ImageCache
+IMAGE_CACHE_BYTES = 16 * 1024 * 1024
+
+# sign ID -> cached file path and cached file path -> sign ID, read from the index on first use
+_cached_paths = None
+_crop_signs = None
+# The ThumbnailAtlas of CACHE_DIR, opened on first use
+_atlas = None
+
+# The SheetStore of a build_cache worker process, so it maps each sheet once for all its batches
+_worker_sheets = None
+
+
+def resize_image(img, max_size):
+    """Resize image maintaining aspect ratio."""
+    width, height = img.size
+    if width > height:
+        new_width = max_size
+        new_height = int(height * max_size / width)
+    else:
+        new_height = max_size
+        new_width = int(width * max_size / height)
+
+    # Large sources: get cheaply close to the target first (JPEG draft decodes
+    # at 1/2..1/8 scale, reducing_gap box-averages by a whole factor down to at
+    # least RESIZE_GAP times the target), so LANCZOS only runs over a small image
+    if img.format == "JPEG" and img.mode in ("RGB", "L"):
+        img.draft(img.mode, (new_width * RESIZE_GAP, new_height * RESIZE_GAP))
+
+    # Pillow ignores reducing_gap for images with alpha (all the sign sheets),
+    # so do its premultiply step here and keep the reduction
+    if img.mode in ("LA", "RGBA"):
+        premultiplied = img.convert(img.mode[:-1] + "a")
+        resized = premultiplied.resize((new_width, new_height), Image.LANCZOS, reducing_gap=RESIZE_GAP)
+        return resized.convert(img.mode)
+
+    return img.resize((new_width, new_height), Image.LANCZOS, reducing_gap=RESIZE_GAP)
+
+
+def sign_id_for(image):
+    """Returns the sign_crops key for an image path such as 'images/17.jpg', or None."""
+    match = re.search(r"(\d+)\.\w+$", image or "")
+    return f"sign{match.group(1)}" if match else None
+
+
+def file_hash(path):
+    """Returns the SHA-256 of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def crop_key(sheet_digest, box):
+    """Cache key of one crop: changes whenever its sheet's content or its box changes."""
+    return hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{sheet_digest}:{tuple(box)}".encode()).hexdigest()[:16]
+
+
+def read_index(cache_dir=CACHE_DIR):
+    """
+    Returns the cache index {"signs": {sign ID: crop file name}, "skipped": {sign ID: crop key}},
+    or an empty one if it is missing or outdated.
+    """
+    try:
+        with open(os.path.join(cache_dir, INDEX_NAME), encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = {}
+    if index.get("format") != CACHE_FORMAT_VERSION:
+        return {"signs": {}, "skipped": {}}
+    return index
+
+
+class SheetStore:
+    """
+    The sign sheets as raw RGBA buffers, decoded at most once.
+
+    The first time a sheet is asked for, its PNG is decoded and written to the
+    cache folder as <sheet>-<content hash>.rgba. From then on, in this run,
+    later runs and other processes, that file is memory-mapped instead, and
+    crops are views into the mapping: no pixels are copied until the crop is
+    turned into an image to resize or save.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, sheet_dir=SHEET_DIR):
+        self.cache_dir = cache_dir
+        self.sheet_dir = sheet_dir
+        # page -> (width, height, mmap)
+        self._sheets = {}
+
+    def raw_name(self, page, digest):
+        return f"{os.path.splitext(page)[0]}-{digest[:16]}.rgba"
+
+    def _decode(self, page, raw_path):
+        """Decodes a sheet PNG into the raw file at raw_path."""
+        with Image.open(os.path.join(self.sheet_dir, page)) as img:
+            rgba = img.convert("RGBA")
+        tmp_path = f"{raw_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(RAW_HEADER.pack(RAW_MAGIC, rgba.width, rgba.height))
+            f.write(rgba.tobytes())
+        os.replace(tmp_path, raw_path)
+
+    def sheet(self, page, digest=None):
+        """Returns (width, height, buffer) of a sheet; buffer holds height rows of width RGBA pixels."""
+        if page not in self._sheets:
+            digest = digest or file_hash(os.path.join(self.sheet_dir, page))
+            raw_path = os.path.join(self.cache_dir, self.raw_name(page, digest))
+            if not os.path.exists(raw_path):
+                os.makedirs(self.cache_dir, exist_ok=True)
+                self._decode(page, raw_path)
+            with open(raw_path, "rb") as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, width, height = RAW_HEADER.unpack_from(mapping)
+            if magic != RAW_MAGIC or len(mapping) != RAW_HEADER.size + width * height * 4:
+                raise ValueError(f"{raw_path} is not a raw sheet file")
+            self._sheets[page] = (width, height, mapping)
+        return self._sheets[page]
+
+    def size(self, page, digest=None):
+        width, height, _ = self.sheet(page, digest)
+        return width, height
+
+    def crop(self, page, box, digest=None):
+        """
+        Returns the pixels in box as a (height, width, 4) NumPy view into the
+        mapped sheet, or, without NumPy, a memoryview of the whole sheet.
+        """
+        width, height, mapping = self.sheet(page, digest)
+        pixels = memoryview(mapping)[RAW_HEADER.size:]
+        if numpy is None:
+            return pixels
+        left, top, right, bottom = box
+        return numpy.frombuffer(pixels, dtype=numpy.uint8).reshape(height, width, 4)[top:bottom, left:right]
+
+    def crop_image(self, page, box, digest=None):
+        """Returns box as a PIL image. This is where the crop's pixels are copied."""
+        view = self.crop(page, box, digest)
+        if numpy is not None:
+            return Image.fromarray(numpy.ascontiguousarray(view), "RGBA")
+        width, height, _ = self.sheet(page, digest)
+        sheet = Image.frombuffer("RGBA", (width, height), view, "raw", "RGBA", 0, 1)
+        return sheet.crop(box)
+
+
+class ThumbnailAtlas:
+    """
+    Every sign thumbnail, PNG-encoded, in one memory-mapped file.
+
+    The file starts with ATLAS_HEADER and a JSON index
+    {sign ID: {"crop": crop file name, "sizes": {"<size>": [offset, length, width, height]}}},
+    offsets counted from the start of the file. Opening it is one open() and
+    one mmap; a thumbnail is then a slice of the mapping.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            # Identifies this build of the atlas, e.g. in cache keys; a rebuild replaces the file
+            self.stamp = os.fstat(f.fileno()).st_mtime_ns
+        magic, version, index_length = ATLAS_HEADER.unpack_from(self._mapping)
+        if magic != ATLAS_MAGIC or version != CACHE_FORMAT_VERSION:
+            self._mapping.close()
+            raise ValueError(f"{path} is not a thumbnail atlas of format {CACHE_FORMAT_VERSION}")
+        start = ATLAS_HEADER.size
+        self.index = json.loads(bytes(self._mapping[start:start + index_length]))
+
+    def __contains__(self, sign_id):
+        return sign_id in self.index
+
+    def crop_name(self, sign_id):
+        """The crop file the thumbnails of sign_id were made from."""
+        return self.index[sign_id]["crop"]
+
+    def data(self, sign_id, size):
+        """Returns the PNG bytes of one thumbnail, or None."""
+        entry = self.index.get(sign_id, {}).get("sizes", {}).get(str(size))
+        if entry is None:
+            return None
+        offset, length, _, _ = entry
+        return self._mapping[offset:offset + length]
+
+    def close(self):
+        self._mapping.close()
+
+    @staticmethod
+    def write(path, thumbnails):
+        """
+        Writes an atlas of thumbnails {sign ID: (crop file name, {size: (PNG bytes, width, height)})}.
+        """
+        index = {}
+        blobs = []
+        offset = 0
+        for sign_id, (crop_name, sizes) in thumbnails.items():
+            entry = index[sign_id] = {"crop": crop_name, "sizes": {}}
+            for size, (data, width, height) in sizes.items():
+                entry["sizes"][str(size)] = [offset, len(data), width, height]
+                blobs.append(data)
+                offset += len(data)
+
+        # Offsets so far count from the end of the index, whose own length depends on them:
+        # shift them by a guess and grow the guess until the encoded index fits
+        reserved = 0
+        while True:
+            base = ATLAS_HEADER.size + reserved
+            shifted = {
+                sign_id: {"crop": entry["crop"], "sizes": {
+                    size: [start + base, length, width, height]
+                    for size, (start, length, width, height) in entry["sizes"].items()
+                }}
+                for sign_id, entry in index.items()
+            }
+            encoded = json.dumps(shifted, separators=(",", ":")).encode()
+            if len(encoded) <= reserved:
+                break
+            reserved = len(encoded) + 64
+        encoded = encoded.ljust(reserved)
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(ATLAS_HEADER.pack(ATLAS_MAGIC, CACHE_FORMAT_VERSION, len(encoded)))
+            f.write(encoded)
+            for data in blobs:
+                f.write(data)
+        os.replace(tmp_path, path)
+
+
+def _open_atlas(cache_dir):
+    """Returns the ThumbnailAtlas in cache_dir, or None if there is no usable one."""
+    try:
+        return ThumbnailAtlas(os.path.join(cache_dir, ATLAS_NAME))
+    except (OSError, ValueError):
+        return None
+
+
+def _encode_png(img):
+    out = io.BytesIO()
+    img.save(out, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return out.getvalue()
+
+
+def _crop_name(sign_id, key):
+    return f"{sign_id}-{key}.png"
+
+
+def _cut_signs(sheets, page, digest, jobs, verbose=False):
+    """
+    Cuts and saves the crops of jobs [(sign ID, box, key), ...], all on one
+    page, and encodes their thumbnails. Returns ({sign ID: (crop file name,
+    {size: (PNG bytes, width, height)})}, {sign ID: key} of boxes outside the
+    sheet, {stage: seconds}).
+    """
+    built = {}
+    skipped = {}
+    timings = {"decode": 0.0, "crop": 0.0, "resize": 0.0, "save": 0.0}
+
+    start = time.perf_counter()
+    width, height = sheets.size(page, digest)
+    timings["decode"] += time.perf_counter() - start
+
+    for sign_id, box, key in jobs:
+        left, top, right, bottom = box
+        if not (0 <= left < right <= width and 0 <= top < bottom <= height):
+            if verbose:
+                print(f"{sign_id}: box {box} is outside {page} ({width}x{height}), skipped")
+            skipped[sign_id] = key
+            continue
+
+        crop_name = _crop_name(sign_id, key)
+        start = time.perf_counter()
+        crop = sheets.crop_image(page, box, digest)
+        timings["crop"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        thumbnails = [resize_image(crop, size) for size in THUMBNAIL_SIZES]
+        timings["resize"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        crop.save(os.path.join(sheets.cache_dir, crop_name), compress_level=PNG_COMPRESS_LEVEL)
+        encoded = {
+            size: (_encode_png(thumbnail), thumbnail.width, thumbnail.height)
+            for size, thumbnail in zip(THUMBNAIL_SIZES, thumbnails)
+        }
+        timings["save"] += time.perf_counter() - start
+        built[sign_id] = (crop_name, encoded)
+
+    return built, skipped, timings
+
+
+def _init_worker(cache_dir, sheet_dir):
+    global _worker_sheets
+    _worker_sheets = SheetStore(cache_dir, sheet_dir)
+
+
+def _cut_signs_in_worker(page, digest, jobs, verbose):
+    return _cut_signs(_worker_sheets, page, digest, jobs, verbose)
+
+
+def _batches(jobs_by_page, count):
+    """Splits each page's jobs into up to count batches, so every worker gets a share of every page."""
+    for page, (digest, jobs) in jobs_by_page.items():
+        for i in range(min(count, len(jobs))):
+            yield page, digest, jobs[i::count]
+
+
+def build_cache(crops=None, cache_dir=CACHE_DIR, sheet_dir=SHEET_DIR, verbose=False,
+                workers=1, force=False, timings=None):
+    """
+    Brings the crop cache up to date with sign_crops and the sheets.
+
+    Each sign gets its crop file, and its THUMBNAIL_SIZES thumbnails go into
+    the atlas, which is rewritten whenever anything changed.
+    Only entries whose box or sheet content changed are cut again (every entry
+    if force is set), from the SheetStore, so a sheet is only decoded if it
+    changed since any earlier run and one of its crops is needed. Boxes
+    that fall outside their sheet are skipped (and remembered, so they do not
+    cost a decode on every start). Returns counts of built, reused, skipped
+    and removed files.
+
+    With workers > 1 (0 for one per CPU) the cutting is spread over a process
+    pool, each worker taking a slice of every page that needs work. If a
+    timings dict is given it receives the seconds spent per stage; the
+    decode/crop/resize/save stages are summed over all workers.
+    """
+    global _cached_paths, _crop_signs, _atlas
+    crops = sign_crops if crops is None else crops
+    workers = workers or os.cpu_count() or 1
+    timings = {} if timings is None else timings
+    os.makedirs(cache_dir, exist_ok=True)
+    old_index = {"signs": {}, "skipped": {}} if force else read_index(cache_dir)
+    old_atlas = None if force else _open_atlas(cache_dir)
+    index = {}
+    thumbnails = {}
+    skipped = {}
+    digests = {}
+    sheets = SheetStore(cache_dir, sheet_dir)
+    stats = {"built": 0, "reused": 0, "skipped": 0, "removed": 0}
+
+    # Plan: hash the sheets and find the entries that need cutting, grouped by page
+    start = time.perf_counter()
+    jobs_by_page = {}
+    for sign_id, (page, box) in crops.items():
+        if page not in digests:
+            digests[page] = file_hash(os.path.join(sheet_dir, page))
+        key = crop_key(digests[page], box)
+        crop_name = _crop_name(sign_id, key)
+
+        if (old_index["signs"].get(sign_id) == crop_name and os.path.exists(os.path.join(cache_dir, crop_name))
+                and old_atlas is not None and sign_id in old_atlas and old_atlas.crop_name(sign_id) == crop_name):
+            index[sign_id] = crop_name
+            thumbnails[sign_id] = None  # Still in the old atlas, only copied if it has to be rewritten
+            stats["reused"] += 1
+        elif old_index["skipped"].get(sign_id) == key:
+            skipped[sign_id] = key
+            stats["skipped"] += 1
+        else:
+            jobs_by_page.setdefault(page, (digests[page], []))[1].append((sign_id, box, key))
+    timings["plan"] = time.perf_counter() - start
+
+    # Cut: in this process, or one slice of each page per worker
+    start = time.perf_counter()
+    if workers > 1 and jobs_by_page:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(cache_dir, sheet_dir)) as pool:
+            futures = [pool.submit(_cut_signs_in_worker, page, digest, jobs, verbose)
+                       for page, digest, jobs in _batches(jobs_by_page, workers)]
+            results = [future.result() for future in futures]
+    else:
+        results = [_cut_signs(sheets, page, digest, jobs, verbose)
+                   for page, (digest, jobs) in jobs_by_page.items()]
+    for built, outside, stage_times in results:
+        index.update((sign_id, crop_name) for sign_id, (crop_name, _) in built.items())
+        thumbnails.update(built)
+        skipped.update(outside)
+        stats["built"] += len(built)
+        stats["skipped"] += len(outside)
+        for stage, seconds in stage_times.items():
+            timings[stage] = timings.get(stage, 0.0) + seconds
+    timings["cut"] = time.perf_counter() - start
+
+    # Pack the thumbnails, unless nothing changed and the old atlas still holds them all
+    start = time.perf_counter()
+    unchanged = old_atlas is not None and stats["built"] == 0 and set(old_atlas.index) == set(thumbnails)
+    if not unchanged:
+        for sign_id in [sign_id for sign_id, entry in thumbnails.items() if entry is None]:
+            thumbnails[sign_id] = (index[sign_id], {
+                size: (old_atlas.data(sign_id, size), width, height)
+                for size, (_, _, width, height) in old_atlas.index[sign_id]["sizes"].items()
+            })
+        # Windows cannot replace a file that is still mapped, and the reused thumbnails
+        # are copied out by now
+        if old_atlas is not None:
+            old_atlas.close()
+            old_atlas = None
+        if _atlas is not None:
+            _atlas.close()
+            _atlas = None
+        ThumbnailAtlas.write(os.path.join(cache_dir, ATLAS_NAME), thumbnails)
+    if old_atlas is not None:
+        old_atlas.close()
+    timings["atlas"] = time.perf_counter() - start
+
+    # Drop files no entry points to any more (old boxes, old sheets, removed signs)
+    start = time.perf_counter()
+    keep = set(index.values())
+    keep.update(sheets.raw_name(page, digest) for page, digest in digests.items())
+    for name in os.listdir(cache_dir):
+        if name.endswith((".png", ".rgba")) and name not in keep:
+            os.remove(os.path.join(cache_dir, name))
+            stats["removed"] += 1
+
+    tmp_path = os.path.join(cache_dir, INDEX_NAME + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"format": CACHE_FORMAT_VERSION, "signs": index, "skipped": skipped}, f, indent=1)
+    os.replace(tmp_path, os.path.join(cache_dir, INDEX_NAME))
+    timings["clean"] = time.perf_counter() - start
+
+    _cached_paths = _crop_signs = None
+    return stats
+
+
+def _load_index(cache_dir=CACHE_DIR):
+    global _cached_paths, _crop_signs
+    signs = read_index(cache_dir)["signs"]
+    _cached_paths = {sign_id: os.path.join(cache_dir, name) for sign_id, name in signs.items()}
+    _crop_signs = {path: sign_id for sign_id, path in _cached_paths.items()}
+
+
+def cached_sign_path(sign_id, cache_dir=CACHE_DIR):
+    """Returns the path of the cached crop for sign_id, or None if it has none."""
+    if _cached_paths is None:
+        _load_index(cache_dir)
+    return _cached_paths.get(sign_id)
+
+
+def atlas_sign(path, cache_dir=CACHE_DIR):
+    """Returns (atlas, sign ID) when path is a cached crop whose thumbnails are in the atlas, else None."""
+    global _atlas
+    if _crop_signs is None:
+        _load_index(cache_dir)
+    sign_id = _crop_signs.get(path)
+    if sign_id is None:
+        return None
+    if _atlas is None:
+        _atlas = _open_atlas(cache_dir)
+        if _atlas is None:
+            return None
+    return (_atlas, sign_id) if sign_id in _atlas else None
+
+
+class ImageCache:
+    """
+    Bounded LRU cache of resized sign images. Crops in the thumbnail atlas are
+    keyed by (atlas, atlas stamp, sign ID, size), without touching their files;
+    other images by (path, size, mtime), the mtime read on every lookup so an
+    edited file is never served stale.
+
+    Each entry holds the resized PIL image and, once photo() has been asked for
+    it, the PhotoImage built from it. Entries are counted as 4 bytes per pixel
+    (twice once a PhotoImage exists) and the least recently used ones are
+    dropped when the total goes over max_bytes. hits and misses count lookups.
+
+    image() may be called from any thread (see ImagePrefetcher); photo() only
+    from the Tk thread.
+    """
+
+    def __init__(self, max_bytes=IMAGE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # key -> [PIL image, PhotoImage or None, bytes counted]
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Evicted PhotoImages, released by the Tk thread: Tk objects must not be freed from a worker
+        self._dropped = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _key(self, path, size, found):
+        # Crops in the atlas are keyed on the atlas build: their file names are content
+        # hashes already, so there is no file to stat
+        if found is not None:
+            atlas, sign_id = found
+            return atlas.path, atlas.stamp, sign_id, size
+        # Anything else is stat'ed on every lookup: a file replaced at the same path
+        # gets a new key and is decoded again, while its stale entry ages out of the LRU
+        return path, size, os.stat(path).st_mtime_ns
+
+    def _entry(self, path, size):
+        # Returns (key, entry)
+        found = atlas_sign(path)
+        key = self._key(path, size, found)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return key, entry
+            self.misses += 1
+
+        # Decode outside the lock so the Tk thread never waits on a worker's decode.
+        # Cached crops come ready-sized out of the thumbnail atlas, anything else is resized here.
+        thumbnail = found[0].data(found[1], size) if found is not None else None
+        with Image.open(io.BytesIO(thumbnail) if thumbnail is not None else path) as img:
+            resized = img.copy() if thumbnail is not None else resize_image(img, size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:  # Unless another thread got there first
+                entry = [resized, None, resized.width * resized.height * 4]
+                self._entries[key] = entry
+                self.bytes += entry[2]
+                self._evict()
+            return key, entry
+
+    def _evict(self):
+        # Always keep the newest entry, even if it alone is over budget
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, photo, size) = self._entries.popitem(last=False)
+            self.bytes -= size
+            if photo is not None:
+                self._dropped.append(photo)
+
+    def image(self, path, size):
+        """Returns the image at path resized to fit in size x size pixels."""
+        return self._entry(path, size)[1][0]
+
+    def photo(self, path, size):
+        """Returns a PhotoImage of image(path, size). Must be called from the Tk thread."""
+        key, entry = self._entry(path, size)
+        photo = entry[1]
+        if photo is None:
+            photo = ImageTk.PhotoImage(entry[0])
+            with self._lock:
+                # A worker may have evicted the entry meanwhile; the photo is then
+                # handed out uncached instead of counted against an entry that is gone
+                if self._entries.get(key) is entry and entry[1] is None:
+                    entry[1] = photo
+                    self.bytes += entry[2]
+                    entry[2] *= 2
+                    self._evict()
+        with self._lock:
+            dropped, self._dropped = self._dropped, []
+        del dropped
+        return photo
+
+    def stats(self):
+        """Returns the hit/miss counters and current size, for logging or display."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self.bytes}
+
+
+class ImagePrefetcher:
+    """
+    Decodes and resizes upcoming images on worker threads, into an ImageCache.
+
+    request() can be called as soon as the next image is known. Finished images
+    come back through a queue that poll() drains on the Tk thread (scheduled
+    with widget.after()), where their PhotoImages are built, so displaying them
+    later is a plain cache hit that never touches the disk.
+    """
+
+    def __init__(self, cache, widget, workers=2, interval=25):
+        self.cache = cache
+        self.widget = widget
+        self.interval = interval
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-prefetch")
+        self._finished = queue.SimpleQueue()
+        self._pending = set()
+        self._polling = False
+        self._poll_job = None
+
+    def request(self, path, size):
+        """Starts loading path at size in the background, unless it is already on its way."""
+        key = (path, size)
+        if key in self._pending:
+            return
+        self._pending.add(key)
+        future = self._executor.submit(self.cache.image, path, size)
+        future.add_done_callback(lambda done, key=key: self._finished.put((key, done)))
+        if not self._polling:
+            self._polling = True
+            self._poll_job = self.widget.after(self.interval, self.poll)
+
+    def poll(self):
+        """Tk thread: turns finished images into PhotoImages, and checks again while any are pending."""
+        self._poll_job = None
+        while True:
+            try:
+                key, future = self._finished.get_nowait()
+            except queue.Empty:
+                break
+            self._pending.discard(key)
+            if future.exception() is not None:
+                print(f"Image prefetch error: {future.exception()}")
+                continue
+            # A PhotoImage that cannot be built must not stop the polling; the image is
+            # then loaded (and the error shown) when it is displayed
+            try:
+                self.cache.photo(*key)
+            except Exception as e:
+                print(f"Image prefetch error: {e}")
+
+        if self._pending:
+            self._poll_job = self.widget.after(self.interval, self.poll)
+        else:
+            self._polling = False
+
+    def close(self):
+        """Stops polling and the workers, for when the widget goes away. Requests still running are dropped."""
+        if self._poll_job is not None:
+            self.widget.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class PhotoManager:
+    """
+    Keeps alive the PhotoImages that are on screen, and a few recently shown ones.
+
+    Every place an image can appear (the question card, each review card) is a
+    slot. show() pins a photo to its slot and moves whatever the slot showed
+    before to a short grace list of recently unpinned photos; release_all()
+    empties every slot when a screen goes away. The grace list only delays the
+    release, so a label that is still being switched over never points at a
+    freed image; nothing is taken back out of it (the ImageCache hands out the
+    same PhotoImage again anyway). Anything else is left to the ImageCache
+    budget and the garbage collector, so memory stays flat however long the app runs.
+    """
+
+    def __init__(self, grace_size=8):
+        self._on_screen = {}
+        self._recent = deque(maxlen=grace_size)
+
+    def __len__(self):
+        return len(self._on_screen)
+
+    def show(self, slot, photo):
+        """Pins photo to slot and returns it."""
+        previous = self._on_screen.get(slot)
+        if previous is not None and previous is not photo:
+            self._recent.append(previous)
+        self._on_screen[slot] = photo
+        return photo
+
+    def release(self, slot):
+        """Unpins whatever slot shows."""
+        previous = self._on_screen.pop(slot, None)
+        if previous is not None:
+            self._recent.append(previous)
+
+    def release_all(self):
+        """Unpins every slot, e.g. before the widgets showing them are destroyed."""
+        self._recent.extend(self._on_screen.values())
+        self._on_screen.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cut the sign crops and thumbnails out of the sign sheets.")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes, 0 for one per CPU (default: 1)")
+    parser.add_argument("--force", action="store_true", help="cut every sign again, even if it is up to date")
+    args = parser.parse_args()
+
+    timings = {}
+    result = build_cache(verbose=True, workers=args.jobs, force=args.force, timings=timings)
+    print(", ".join(f"{count} {what}" for what, count in result.items()) + f" in {CACHE_DIR}")
+    print(", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items()))